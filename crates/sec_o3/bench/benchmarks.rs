@@ -1,8 +1,8 @@
 // benches/benchmarks.rs - Performance benchmarks
 use criterion::{black_box, criterion_group, criterion_main, Criterion, BenchmarkId};
 use sec_o3::{
-    corp::normalize_cik,
     parse::{parse_html, parse_json, parse_auto},
+    utils::normalize_cik,
 };
 
 // ============================================================================
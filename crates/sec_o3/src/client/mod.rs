@@ -44,12 +44,21 @@ use std::path::Path;
 use std::sync::Arc;
 use std::time::Duration;
 use tokio::fs;
-use tokio::io::{AsyncReadExt, BufReader};
+use tokio::io::{AsyncRead, AsyncReadExt, BufReader};
+use tokio_util::io::StreamReader;
 
 use crate::errors::{Error, Result};
 use rate_limit::RateLimiter;
 use retry::RetryPolicy;
 
+/// Idle keep-alive connections kept per host. SEC traffic goes to two hosts
+/// (`www.sec.gov`, `data.sec.gov`) and is capped at 10 req/s, so a handful of
+/// warm connections covers every in-flight request.
+const POOL_MAX_IDLE_PER_HOST: usize = 8;
+
+/// Upper bound on buffer space reserved up front from a `Content-Length` header.
+const MAX_PREALLOC: usize = 256 * 1024 * 1024;
+
 /// SEC API client with rate limiting, retry support, and async decompression.
 #[derive(Clone)]
 pub struct Client {
@@ -66,12 +75,7 @@ struct ClientInner {
 impl Client {
     /// Create a new SEC client with default settings.
     pub fn new(contact_name: &str, contact_email: &str) -> Self {
-        let https = HttpsConnector::new();
-        let client = hyper::Client::builder()
-            .pool_idle_timeout(Duration::from_secs(30))
-            .http2_keep_alive_interval(Some(Duration::from_secs(15)))
-            .http2_keep_alive_timeout(Duration::from_secs(5))
-            .build::<_, Body>(https);
+        let client = build_http_client();
 
         Self {
             inner: Arc::new(ClientInner {
@@ -93,12 +97,7 @@ impl Client {
             ));
         }
 
-        let https = HttpsConnector::new();
-        let client = hyper::Client::builder()
-            .pool_idle_timeout(Duration::from_secs(30))
-            .http2_keep_alive_interval(Some(Duration::from_secs(15)))
-            .http2_keep_alive_timeout(Duration::from_secs(5))
-            .build::<_, Body>(https);
+        let client = build_http_client();
 
         Ok(Self {
             inner: Arc::new(ClientInner {
@@ -128,7 +127,8 @@ impl Client {
     /// Get response body as UTF-8 string with automatic decompression.
     pub async fn get_text(&self, url: &str) -> Result<String> {
         let bytes = self.get_bytes(url).await?;
-        String::from_utf8(bytes.to_vec()).map_err(|e| Error::Custom(format!("Invalid UTF-8: {}", e)))
+        // Reuses the body buffer when it is uniquely owned instead of copying it
+        String::from_utf8(Vec::from(bytes)).map_err(|e| Error::Custom(format!("Invalid UTF-8: {}", e)))
     }
 
     /// Fetch and deserialize JSON with automatic decompression.
@@ -168,7 +168,7 @@ impl Client {
             .map(|s| s.to_lowercase());
 
         let body = response.into_body();
-        let mut reader = tokio_util::io::StreamReader::new(body.map_err(std::io::Error::other));
+        let mut reader = StreamReader::new(body.map_err(std::io::Error::other));
 
         let mut file = fs::File::create(path).await.map_err(Error::IoError)?;
 
@@ -194,6 +194,9 @@ impl Client {
     }
 
     /// Asynchronously decodes response body based on Content-Encoding header.
+    ///
+    /// Compressed bodies are decoded as they stream in, so the compressed and
+    /// decompressed copies of a large filing are never both held in memory.
     async fn decode_response(&self, response: Response<Body>) -> Result<bytes::Bytes> {
         let encoding = response
             .headers()
@@ -201,32 +204,33 @@ impl Client {
             .and_then(|v| v.to_str().ok())
             .map(|s| s.to_lowercase());
 
-        let body = hyper::body::to_bytes(response.into_body())
-            .await
-            .map_err(Error::HyperError)?;
+        // Compressed length when an encoding is applied, so only a lower bound
+        let capacity = response
+            .headers()
+            .get(hyper::header::CONTENT_LENGTH)
+            .and_then(|v| v.to_str().ok())
+            .and_then(|s| s.parse::<usize>().ok())
+            .unwrap_or(0)
+            .min(MAX_PREALLOC);
+
+        let body = response.into_body();
 
         match encoding.as_deref() {
             Some("gzip") => {
-                let mut decoder = GzipDecoder::new(BufReader::new(&body[..]));
-                let mut decoded = Vec::new();
-                decoder
-                    .read_to_end(&mut decoded)
+                let reader = StreamReader::new(body.map_err(std::io::Error::other));
+                read_all(GzipDecoder::new(reader), capacity)
                     .await
-                    .map_err(|e| Error::Custom(format!("Gzip decompression failed: {}", e)))?;
-                Ok(bytes::Bytes::from(decoded))
+                    .map_err(|e| Error::Custom(format!("Gzip decompression failed: {}", e)))
             }
             Some("deflate") => {
-                let mut decoder = ZlibDecoder::new(BufReader::new(&body[..]));
-                let mut decoded = Vec::new();
-                decoder
-                    .read_to_end(&mut decoded)
+                let reader = StreamReader::new(body.map_err(std::io::Error::other));
+                read_all(ZlibDecoder::new(reader), capacity)
                     .await
-                    .map_err(|e| Error::Custom(format!("Deflate decompression failed: {}", e)))?;
-                Ok(bytes::Bytes::from(decoded))
+                    .map_err(|e| Error::Custom(format!("Deflate decompression failed: {}", e)))
             }
             Some("identity") | None => {
-                // No compression
-                Ok(body)
+                // Sized from the body's length hint, i.e. Content-Length
+                hyper::body::to_bytes(body).await.map_err(Error::HyperError)
             }
             Some(other) => Err(Error::Custom(format!("Unsupported encoding: {}", other))),
         }
@@ -271,3 +275,23 @@ impl Client {
             .await
     }
 }
+
+/// Build the pooled HTTPS client shared by every clone of a [`Client`].
+///
+/// Connections are kept alive between requests, so only the first request to
+/// each host pays for the TCP and TLS handshakes.
+fn build_http_client() -> hyper::Client<HttpsConnector<HttpConnector>> {
+    hyper::Client::builder()
+        .pool_idle_timeout(Duration::from_secs(90))
+        .pool_max_idle_per_host(POOL_MAX_IDLE_PER_HOST)
+        .http2_keep_alive_interval(Some(Duration::from_secs(15)))
+        .http2_keep_alive_timeout(Duration::from_secs(5))
+        .build::<_, Body>(HttpsConnector::new())
+}
+
+/// Read `reader` to completion into a buffer with `capacity` bytes reserved.
+async fn read_all<R: AsyncRead + Unpin>(mut reader: R, capacity: usize) -> std::io::Result<bytes::Bytes> {
+    let mut buf = Vec::with_capacity(capacity);
+    reader.read_to_end(&mut buf).await?;
+    Ok(bytes::Bytes::from(buf))
+}
@@ -26,6 +26,10 @@ pub enum Error {
     #[error("JSON parsing failed: {0}")]
     JsonError(#[from] serde_json::Error),
 
+    /// Document content could not be parsed or classified.
+    #[error("Document parsing failed: {0}")]
+    ParseError(String),
+
     /// Failed to parse XML response.
     #[error("XML parsing failed: {0}")]
     XmlError(String),
@@ -0,0 +1,119 @@
+//! XBRL company facts from the SEC `companyfacts` API.
+//!
+//! A large filer's payload runs to tens of megabytes, almost all of it in
+//! per-concept unit arrays. Taxonomies are kept as raw JSON slices after the
+//! initial parse and only deserialized when a caller asks for one, so
+//! consumers that touch `cik`, `entityName` and a single taxonomy never
+//! build the rest of the tree.
+use serde::de::DeserializeOwned;
+use serde::Deserialize;
+use serde_json::value::RawValue;
+use std::collections::HashMap;
+
+use crate::utils::normalize_cik;
+use crate::{Client, Error, Result};
+
+/// Company facts with lazily materialized taxonomies.
+#[derive(Debug, Deserialize)]
+#[serde(rename_all = "camelCase")]
+pub struct CompanyFacts {
+    /// Company's Central Index Key
+    pub cik: u64,
+    /// Company name as registered with the SEC
+    pub entity_name: String,
+    /// Taxonomy name (e.g. "us-gaap", "dei") -> unparsed concept map
+    facts: HashMap<String, Box<RawValue>>,
+}
+
+impl CompanyFacts {
+    /// Names of the taxonomies present (e.g. "us-gaap", "dei").
+    pub fn taxonomies(&self) -> impl Iterator<Item = &str> {
+        self.facts.keys().map(String::as_str)
+    }
+
+    /// Whether the given taxonomy is present.
+    pub fn has_taxonomy(&self, name: &str) -> bool {
+        self.facts.contains_key(name)
+    }
+
+    /// Raw JSON text of a taxonomy, without deserializing it.
+    pub fn taxonomy_raw(&self, name: &str) -> Option<&str> {
+        self.facts.get(name).map(|raw| raw.get())
+    }
+
+    /// Deserialize a single taxonomy on demand.
+    ///
+    /// Returns `Ok(None)` if the taxonomy is absent.
+    pub fn taxonomy<T: DeserializeOwned>(&self, name: &str) -> Result<Option<T>> {
+        self.facts
+            .get(name)
+            .map(|raw| serde_json::from_str(raw.get()))
+            .transpose()
+            .map_err(Error::JsonError)
+    }
+}
+
+/// Fetch XBRL company facts by CIK.
+///
+/// # Errors
+///
+/// Returns `Error::NotFound` for unknown CIKs and `Error::JsonError` if the
+/// response is not a company facts document.
+///
+/// # Examples
+///
+/// ```no_run
+/// use sec_o3::facts::get_company_facts;
+/// use sec_o3::Client;
+///
+/// #[tokio::main]
+/// async fn main() -> sec_o3::Result<()> {
+///     let client = Client::new("MyApp", "contact@example.com");
+///     let facts = get_company_facts(&client, "320193").await?;
+///
+///     println!("{} has us-gaap: {}", facts.entity_name, facts.has_taxonomy("us-gaap"));
+///     Ok(())
+/// }
+/// ```
+pub async fn get_company_facts(client: &Client, cik: &str) -> Result<CompanyFacts> {
+    let cik_padded = format!("CIK{}", normalize_cik(cik)?);
+    let url = format!(
+        "https://data.sec.gov/api/xbrl/companyfacts/{}.json",
+        cik_padded
+    );
+
+    client.get_json(&url).await
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use serde_json::Value;
+
+    const SAMPLE: &str = r#"{
+        "cik": 320193,
+        "entityName": "Apple Inc.",
+        "facts": {
+            "dei": {"EntityCommonStockSharesOutstanding": {"label": "Shares"}},
+            "us-gaap": {"Revenues": {"label": "Revenues", "units": {"USD": [{"val": 1}]}}}
+        }
+    }"#;
+
+    #[test]
+    fn test_header_fields() {
+        let facts: CompanyFacts = serde_json::from_str(SAMPLE).unwrap();
+        assert_eq!(facts.cik, 320193);
+        assert_eq!(facts.entity_name, "Apple Inc.");
+        assert!(facts.has_taxonomy("us-gaap"));
+        assert!(!facts.has_taxonomy("ifrs-full"));
+    }
+
+    #[test]
+    fn test_taxonomy_on_demand() {
+        let facts: CompanyFacts = serde_json::from_slice(SAMPLE.as_bytes()).unwrap();
+        let gaap: Value = facts.taxonomy("us-gaap").unwrap().unwrap();
+        assert_eq!(gaap["Revenues"]["label"], "Revenues");
+        assert!(facts.taxonomy::<Value>("ifrs-full").unwrap().is_none());
+        assert!(facts.taxonomy_raw("dei").unwrap().contains("EntityCommonStockSharesOutstanding"));
+    }
+}
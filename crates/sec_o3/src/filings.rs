@@ -4,6 +4,7 @@
 //! - Fetch company submission history
 //! - Download specific filing documents (XML, HTML, text)
 //! - Parse filing metadata and document URLs
+use crate::utils::normalize_cik;
 use crate::{Client, Error, Result};
 use chrono::{DateTime, Utc};
 use serde::Deserialize;
@@ -81,11 +82,11 @@ pub struct RecentFilings {
     #[serde(default)]
     pub size: Vec<i64>,
     /// Whether filing contains XBRL data (1 = yes, 0 = no)
-    #[serde(rename(deserialize = "isXRBL"))]
+    #[serde(rename(deserialize = "isXBRL"))]
     #[serde(default)]
     pub is_xbrl: Vec<i32>,
     /// Whether filing contains Inline XBRL (1 = yes, 0 = no)
-    #[serde(rename(deserialize = "isInlineXRBL"))]
+    #[serde(rename(deserialize = "isInlineXBRL"))]
     #[serde(default)]
     pub is_inline_xbrl: Vec<i32>,
     /// Primary document filename (e.g., "aapl-20230930.htm")
@@ -96,6 +97,79 @@ pub struct RecentFilings {
     pub primary_doc_description: Vec<String>,
 }
 
+/// The subset of a submissions document that [`get_recent_filings`] reads.
+///
+/// Every other field (and every other `recent` column) is skipped by serde
+/// without being allocated, which is most of a multi-megabyte payload.
+#[derive(Debug, Deserialize)]
+struct RecentColumns {
+    cik: String,
+    filings: RecentColumnsFilings,
+}
+
+#[derive(Debug, Deserialize)]
+struct RecentColumnsFilings {
+    recent: RecentColumnsData,
+}
+
+#[derive(Debug, Deserialize)]
+#[serde(rename_all = "camelCase")]
+struct RecentColumnsData {
+    accession_number: Vec<String>,
+    #[serde(default)]
+    acceptance_date_time: Vec<String>,
+    #[serde(default)]
+    form: Vec<String>,
+    #[serde(default)]
+    primary_document: Vec<String>,
+    #[serde(default, rename = "isXBRL")]
+    is_xbrl: Vec<i32>,
+}
+
+impl RecentColumns {
+    /// Turn the column-oriented arrays into filings, moving strings rather
+    /// than cloning them. Rows without a primary document, form type or
+    /// valid acceptance time are dropped.
+    fn into_filings(self) -> Vec<Filing> {
+        let cik = self.cik;
+        let RecentColumnsData {
+            accession_number,
+            acceptance_date_time,
+            form,
+            primary_document,
+            is_xbrl,
+        } = self.filings.recent;
+
+        let mut forms = form.into_iter();
+        let mut xbrl = is_xbrl.into_iter();
+
+        accession_number
+            .into_iter()
+            .zip(primary_document)
+            .zip(acceptance_date_time)
+            .filter_map(|((accession_number, primary_document), accepted)| {
+                // Optional columns are advanced for every row to stay aligned
+                let form_type = forms.next().unwrap_or_default();
+                let is_xbrl = xbrl.next().unwrap_or(0) == 1;
+
+                if primary_document.is_empty() || form_type.is_empty() {
+                    return None;
+                }
+                let acceptance_date = accepted.parse::<DateTime<Utc>>().ok()?;
+
+                Some(Filing {
+                    cik: cik.clone(),
+                    accession_number,
+                    form_type,
+                    acceptance_date,
+                    primary_document,
+                    is_xbrl,
+                })
+            })
+            .collect()
+    }
+}
+
 /// A specific filing document
 ///
 /// Represents a single SEC filing with methods to construct
@@ -162,10 +236,15 @@ impl Filing {
 /// }
 /// ```
 pub async fn get_submissions(client: &Client, cik: &str) -> Result<Submissions> {
-    let cik_padded = format!("CIK{:0>10}", cik.trim_start_matches("CIK"));
-    let url = format!("https://data.sec.gov/submissions/{}.json", cik_padded);
+    client.get_json(&submissions_url(cik)?).await
+}
 
-    client.get_json(&url).await
+/// Submissions API URL for a CIK in any accepted format.
+fn submissions_url(cik: &str) -> Result<String> {
+    Ok(format!(
+        "https://data.sec.gov/submissions/CIK{}.json",
+        normalize_cik(cik)?
+    ))
 }
 
 /// Get a list of recent filings for a company
@@ -184,39 +263,14 @@ pub async fn get_submissions(client: &Client, cik: &str) -> Result<Submissions>
 ///     let filings = get_recent_filings(&client, "0000320193").await?;
 ///
 ///     for filing in filings.iter().take(5) {
-///         println!("{} - {} on {}", filing.form_type, filing.primary_document, filing.filing_date);
+///         println!("{} - {} on {}", filing.form_type, filing.primary_document, filing.acceptance_date);
 ///     }
 ///     Ok(())
 /// }
 /// ```
 pub async fn get_recent_filings(client: &Client, cik: &str) -> Result<Vec<Filing>> {
-    let submissions = get_submissions(client, cik).await?;
-    let recent = submissions.filings.recent;
-
-    let filings = (0..recent.accession_number.len())
-        .filter_map(|i| {
-            // Filter out empty values
-            let primary_document = recent.primary_document.get(i)?.clone();
-            let form_type = recent.form.get(i).cloned().unwrap_or_default();
-            if primary_document.is_empty() || form_type.is_empty() {
-                return None;
-            }
-
-            // Ensure acceptance_date is a valid UTC string
-            let acceptance_date = recent.acceptance_date_time.get(i)?.parse::<DateTime<Utc>>().ok()?;
-
-            Some(Filing {
-                cik: submissions.cik.clone(),
-                accession_number: recent.accession_number[i].clone(),
-                form_type,
-                acceptance_date,
-                primary_document,
-                is_xbrl: recent.is_xbrl.get(i).copied().unwrap_or(0) == 1,
-            })
-        })
-        .collect();
-
-    Ok(filings)
+    let columns: RecentColumns = client.get_json(&submissions_url(cik)?).await?;
+    Ok(columns.into_filings())
 }
 
 /// Download a filing document (XML, HTML, or text)
@@ -443,6 +497,35 @@ mod tests {
         assert!(!filings.is_empty());
     }
 
+    #[test]
+    fn test_recent_columns_into_filings() {
+        let json = r#"{
+            "cik": "0000320193",
+            "name": "Apple Inc.",
+            "tickers": ["AAPL"],
+            "filings": {
+                "recent": {
+                    "accessionNumber": ["0000320193-23-000106", "0000320193-23-000105", "0000320193-23-000104"],
+                    "acceptanceDateTime": ["2023-11-03T06:01:36.000Z", "2023-11-02T16:30:00.000Z", "not a date"],
+                    "form": ["10-K", "", "8-K"],
+                    "primaryDocument": ["aapl-20230930.htm", "x.htm", "y.htm"],
+                    "isXBRL": [1, 0, 0],
+                    "size": [1, 2, 3]
+                },
+                "files": []
+            }
+        }"#;
+
+        let columns: RecentColumns = serde_json::from_str(json).unwrap();
+        let filings = columns.into_filings();
+
+        assert_eq!(filings.len(), 1);
+        assert_eq!(filings[0].cik, "0000320193");
+        assert_eq!(filings[0].accession_number, "0000320193-23-000106");
+        assert_eq!(filings[0].form_type, "10-K");
+        assert!(filings[0].is_xbrl);
+    }
+
     #[test]
     fn test_filing_urls() {
         let filing = Filing {
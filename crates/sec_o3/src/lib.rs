@@ -32,8 +32,12 @@
 pub mod client;
 /// - `errors` - Unified error handling
 pub mod errors;
+/// - `facts` - XBRL company facts with lazily parsed taxonomies.
+pub mod facts;
 /// - `filings` - Functions for fetching and downloading filings.
 pub mod filings;
+/// - `parse` - Format detection and metadata extraction for SEC documents.
+pub mod parse;
 /// - `utils` - Utility functions for standardizing dates and retrieving CIKs.
 pub mod utils;
 
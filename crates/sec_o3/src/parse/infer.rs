@@ -0,0 +1,122 @@
+//! Form type inference for SEC documents.
+//!
+//! Tries progressively looser strategies, returning the first hit:
+//! 1. `CONFORMED SUBMISSION TYPE:` header field (full submission text files)
+//! 2. `"submissionType"` JSON field
+//! 3. `FORM <type>` keyword (cover pages)
+//! 4. A bare known form token anywhere in the document
+//!
+//! All strategies are compiled into one [`RegexSet`] and swept over the
+//! document together; only the winning strategy is then re-run for its
+//! capture. Word boundaries are ASCII-only (`(?-u:\b)`) so the set stays on
+//! the DFA engines even for documents containing non-ASCII text.
+use once_cell::sync::Lazy;
+use regex::{Regex, RegexSet};
+
+/// Form types recognized by the keyword and bare-token strategies.
+pub const KNOWN_FORMS: &[&str] = &[
+    "10-K", "10-Q", "8-K", "20-F", "40-F", "6-K", "11-K", "S-1", "S-3", "S-4", "S-8",
+    "DEF 14A", "13F-HR", "SC 13D", "SC 13G",
+];
+
+/// Index of the `FORM <type>` strategy, whose capture is upper-cased.
+const FORM_KEYWORD: usize = 2;
+
+/// Strategy patterns in priority order; each captures the form type as group 1.
+static STRATEGIES: Lazy<[Regex; 4]> = Lazy::new(|| {
+    let forms = forms_alternation();
+    [
+        Regex::new(r"CONFORMED SUBMISSION TYPE:[ \t]*(\S+)").expect("valid conformed-type regex"),
+        Regex::new(r#""submissionType"\s*:\s*"([^"]+)""#).expect("valid submissionType regex"),
+        Regex::new(&format!(r"(?i)(?-u:\b)FORM\s+({})(?-u:\b)", forms))
+            .expect("valid form keyword regex"),
+        Regex::new(&format!(r"(?-u:\b)({})(?-u:\b)", forms)).expect("valid form token regex"),
+    ]
+});
+
+static STRATEGY_SET: Lazy<RegexSet> = Lazy::new(|| {
+    RegexSet::new(STRATEGIES.iter().map(Regex::as_str)).expect("valid form strategy set")
+});
+
+fn forms_alternation() -> String {
+    KNOWN_FORMS
+        .iter()
+        .map(|f| regex::escape(f))
+        .collect::<Vec<_>>()
+        .join("|")
+}
+
+/// Infer the SEC form type (e.g. `"10-K"`) from document content.
+///
+/// Returns `None` if no strategy matches.
+///
+/// # Examples
+///
+/// ```
+/// use sec_o3::parse::infer::infer_form_type;
+///
+/// assert_eq!(infer_form_type("CONFORMED SUBMISSION TYPE: 10-Q").as_deref(), Some("10-Q"));
+/// assert_eq!(infer_form_type("This is a FORM 8-K filing").as_deref(), Some("8-K"));
+/// assert_eq!(infer_form_type("nothing to see"), None);
+/// ```
+pub fn infer_form_type(content: &str) -> Option<String> {
+    // SetMatches iterates in pattern order, so the first index is the
+    // highest-priority strategy that matched anywhere in the document
+    let idx = STRATEGY_SET.matches(content).iter().next()?;
+    let caps = STRATEGIES[idx].captures(content)?;
+
+    if idx == FORM_KEYWORD {
+        Some(caps[1].to_ascii_uppercase())
+    } else {
+        Some(caps[1].to_string())
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_conformed_submission_type() {
+        let text = "ACCESSION NUMBER: 0000320193-23-000106\nCONFORMED SUBMISSION TYPE:\t10-K\n";
+        assert_eq!(infer_form_type(text).as_deref(), Some("10-K"));
+    }
+
+    #[test]
+    fn test_json_field() {
+        assert_eq!(
+            infer_form_type(r#"{"submissionType": "DEF 14A"}"#).as_deref(),
+            Some("DEF 14A")
+        );
+    }
+
+    #[test]
+    fn test_form_keyword_case_insensitive() {
+        assert_eq!(infer_form_type("annual report on form 10-k").as_deref(), Some("10-K"));
+    }
+
+    #[test]
+    fn test_direct_token() {
+        assert_eq!(
+            infer_form_type("Filing type is 10-Q for this document").as_deref(),
+            Some("10-Q")
+        );
+    }
+
+    #[test]
+    fn test_strategy_priority_over_position() {
+        let text = "Exhibit to 8-K\nCONFORMED SUBMISSION TYPE: 10-Q\n";
+        assert_eq!(infer_form_type(text).as_deref(), Some("10-Q"));
+    }
+
+    #[test]
+    fn test_non_ascii_neighbours() {
+        assert_eq!(infer_form_type("Société — FORM 20-F — année").as_deref(), Some("20-F"));
+    }
+
+    #[test]
+    fn test_no_partial_token_match() {
+        assert_eq!(infer_form_type("see 10-K405 exhibit"), None);
+        assert_eq!(infer_form_type("No form type here"), None);
+    }
+}
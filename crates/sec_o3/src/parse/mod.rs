@@ -0,0 +1,390 @@
+//! Lightweight SEC document parsing.
+//!
+//! Detects a document's format and extracts the metadata needed downstream
+//! (form type, title, size) without building a full data model. HTML is never
+//! parsed into a DOM: the title is sliced out with a literal search and the
+//! form type is inferred from tag-stripped text, starting with the preamble.
+//!
+//! # Examples
+//!
+//! ```
+//! use sec_o3::parse::{parse_auto, Format};
+//!
+//! let doc = parse_auto(r#"{"submissionType":"8-K"}"#).unwrap();
+//! assert_eq!(doc.format, Format::Json);
+//! assert_eq!(doc.form_type, "8-K");
+//! ```
+pub mod infer;
+
+use once_cell::sync::Lazy;
+use regex::Regex;
+use serde::Deserialize;
+use std::borrow::Cow;
+use std::fmt;
+
+use crate::{Error, Result};
+
+/// Form markers live in the cover page, so HTML inference tries this many
+/// leading bytes before falling back to the whole document.
+const FORM_SCAN_PREFIX: usize = 16 * 1024;
+
+/// The doctype/`<html>` hint must appear within this many leading bytes.
+const HTML_HINT_PREFIX: usize = 4 * 1024;
+
+static TITLE_RE: Lazy<Regex> =
+    Lazy::new(|| Regex::new(r"(?is)<title[^>]*>(.*?)</title\s*>").expect("valid title regex"));
+
+static HTML_HINT_RE: Lazy<regex::bytes::Regex> = Lazy::new(|| {
+    regex::bytes::Regex::new(r"(?i)<!DOCTYPE\s+html|<html[\s>]").expect("valid HTML hint regex")
+});
+
+/// Document formats understood by the parsers.
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Hash)]
+pub enum Format {
+    Html,
+    Json,
+    Text,
+    Xml,
+}
+
+impl Format {
+    /// Display name, e.g. `"HTML"` or `"Text"`.
+    pub fn as_str(&self) -> &'static str {
+        match self {
+            Format::Html => "HTML",
+            Format::Json => "JSON",
+            Format::Text => "Text",
+            Format::Xml => "XML",
+        }
+    }
+}
+
+impl fmt::Display for Format {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        f.write_str(self.as_str())
+    }
+}
+
+/// Metadata extracted from an SEC document.
+#[derive(Debug, Clone, PartialEq, Eq)]
+pub struct Document {
+    /// SEC form type (e.g. "10-K", "8-K", "DEF 14A")
+    pub form_type: String,
+    /// Detected document format
+    pub format: Format,
+    /// Document title, if one is present
+    pub title: Option<String>,
+    /// Size of the parsed content in bytes
+    pub size_bytes: usize,
+}
+
+/// Header fields read from JSON documents; everything else is skipped
+/// without being materialized.
+#[derive(Deserialize)]
+#[serde(rename_all = "camelCase")]
+struct JsonHeader<'a> {
+    #[serde(default, borrow)]
+    submission_type: Option<Cow<'a, str>>,
+    #[serde(default, borrow)]
+    entity_name: Option<Cow<'a, str>>,
+}
+
+/// Parse an HTML document.
+///
+/// # Errors
+///
+/// Returns `Error::ParseError` if no form type can be inferred.
+pub fn parse_html(content: &str) -> Result<Document> {
+    let title = TITLE_RE
+        .captures(content)
+        .map(|caps| unescape_basic(caps[1].trim()).into_owned())
+        .filter(|t| !t.is_empty());
+
+    let form_type = infer_prefix_first(content, |s| infer::infer_form_type(&strip_tags(s)))
+        .ok_or_else(|| {
+            Error::ParseError("Could not determine form type from HTML document".to_string())
+        })?;
+
+    Ok(Document {
+        form_type,
+        format: Format::Html,
+        title,
+        size_bytes: content.len(),
+    })
+}
+
+/// Parse a JSON document from UTF-8 bytes or a string.
+///
+/// Reads straight from the byte buffer, so callers holding raw response
+/// bytes never need to decode them to a `String` first.
+///
+/// # Errors
+///
+/// Returns `Error::JsonError` for malformed JSON and `Error::ParseError` if
+/// the document has no `submissionType`.
+pub fn parse_json(content: impl AsRef<[u8]>) -> Result<Document> {
+    let bytes = content.as_ref();
+    let header: JsonHeader<'_> = serde_json::from_slice(bytes)?;
+
+    let form_type = header.submission_type.ok_or_else(|| {
+        Error::ParseError("JSON document has no submissionType field".to_string())
+    })?;
+
+    Ok(Document {
+        form_type: form_type.into_owned(),
+        format: Format::Json,
+        title: header.entity_name.map(Cow::into_owned),
+        size_bytes: bytes.len(),
+    })
+}
+
+/// Parse a plain-text document (e.g. a full submission `.txt` file).
+///
+/// # Errors
+///
+/// Returns `Error::ParseError` if no form type can be inferred.
+pub fn parse_text(content: &str) -> Result<Document> {
+    let form_type = infer_prefix_first(content, infer::infer_form_type).ok_or_else(|| {
+        Error::ParseError("Could not determine form type from text document".to_string())
+    })?;
+
+    Ok(Document {
+        form_type,
+        format: Format::Text,
+        title: None,
+        size_bytes: content.len(),
+    })
+}
+
+/// Classify `content` from its first non-whitespace byte.
+///
+/// `{`/`[` means JSON and `<` means HTML when a doctype/`<html>` hint is
+/// present in the first 4 KiB (SGML submission files also open with a tag).
+/// Anything else is plain text. No parser runs and at most the prefix is
+/// scanned, so this is cheap even for huge documents.
+///
+/// # Examples
+///
+/// ```
+/// use sec_o3::parse::{detect_format, Format};
+///
+/// assert_eq!(detect_format("  {\"submissionType\": \"8-K\"}"), Format::Json);
+/// assert_eq!(detect_format("<SEC-DOCUMENT>0000320193-23-000106.txt"), Format::Text);
+/// ```
+pub fn detect_format(content: impl AsRef<[u8]>) -> Format {
+    let content = content.as_ref();
+    let body = content.strip_prefix(b"\xEF\xBB\xBF").unwrap_or(content);
+    let first = body.iter().copied().find(|b| !b.is_ascii_whitespace());
+
+    match first {
+        Some(b'{' | b'[') => Format::Json,
+        Some(b'<') if HTML_HINT_RE.is_match(&body[..body.len().min(HTML_HINT_PREFIX)]) => {
+            Format::Html
+        }
+        _ => Format::Text,
+    }
+}
+
+/// Detect the format of `content` and parse it accordingly.
+///
+/// See [`detect_format`]; exactly one parser runs per document.
+///
+/// # Errors
+///
+/// Returns the error from the parser selected for the detected format.
+pub fn parse_auto(content: &str) -> Result<Document> {
+    match detect_format(content) {
+        Format::Json => parse_json(content),
+        Format::Html => parse_html(content),
+        Format::Text | Format::Xml => parse_text(content),
+    }
+}
+
+/// Like [`parse_auto`], but over raw response bytes.
+///
+/// JSON is parsed straight from the buffer; UTF-8 is only validated for
+/// formats whose parsers need `&str`.
+///
+/// # Errors
+///
+/// Returns `Error::ParseError` if a non-JSON document is not valid UTF-8,
+/// otherwise the error from the selected parser.
+pub fn parse_auto_bytes(content: &[u8]) -> Result<Document> {
+    let format = detect_format(content);
+    if format == Format::Json {
+        return parse_json(content);
+    }
+
+    let text = std::str::from_utf8(content)
+        .map_err(|e| Error::ParseError(format!("Document is not valid UTF-8: {}", e)))?;
+    match format {
+        Format::Html => parse_html(text),
+        _ => parse_text(text),
+    }
+}
+
+/// Run `infer` over the leading [`FORM_SCAN_PREFIX`] bytes (the header or
+/// cover page), falling back to the whole document on a miss.
+fn infer_prefix_first(content: &str, infer: impl Fn(&str) -> Option<String>) -> Option<String> {
+    let prefix = &content[..floor_char_boundary(content, FORM_SCAN_PREFIX)];
+    infer(prefix).or_else(|| {
+        if prefix.len() < content.len() {
+            infer(content)
+        } else {
+            None
+        }
+    })
+}
+
+/// Replace tags with spaces, keeping only text content.
+///
+/// Tag contents are skipped wholesale (including attributes), which is
+/// enough for form-type inference and far cheaper than building a DOM.
+fn strip_tags(html: &str) -> String {
+    let mut out = String::with_capacity(html.len());
+    let mut rest = html;
+
+    while let Some(lt) = rest.find('<') {
+        out.push_str(&unescape_basic(&rest[..lt]));
+        out.push(' ');
+        rest = rest[lt..].find('>').map_or("", |gt| &rest[lt + gt + 1..]);
+    }
+    out.push_str(&unescape_basic(rest));
+    out
+}
+
+/// Decode the handful of entities that show up around titles and form markers
+/// (notably `FORM&nbsp;10-K`).
+fn unescape_basic(text: &str) -> Cow<'_, str> {
+    if !text.contains('&') {
+        return Cow::Borrowed(text);
+    }
+    Cow::Owned(
+        text.replace("&nbsp;", " ")
+            .replace("&#160;", " ")
+            .replace("&lt;", "<")
+            .replace("&gt;", ">")
+            .replace("&quot;", "\"")
+            .replace("&#39;", "'")
+            .replace("&amp;", "&"),
+    )
+}
+
+/// Largest char boundary in `s` at or below `index`.
+fn floor_char_boundary(s: &str, index: usize) -> usize {
+    if index >= s.len() {
+        return s.len();
+    }
+    let mut i = index;
+    while !s.is_char_boundary(i) {
+        i -= 1;
+    }
+    i
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_parse_html_with_title() {
+        let html = "<!DOCTYPE html><html><head><title>Apple Inc. 10-K</title></head>\
+                    <body>FORM 10-K Annual Report</body></html>";
+        let doc = parse_html(html).unwrap();
+        assert_eq!(doc.form_type, "10-K");
+        assert_eq!(doc.format, Format::Html);
+        assert_eq!(doc.title.as_deref(), Some("Apple Inc. 10-K"));
+        assert_eq!(doc.size_bytes, html.len());
+    }
+
+    #[test]
+    fn test_parse_html_title_attributes_and_entities() {
+        let html = "<HTML><TITLE lang=\"en\"> AT&amp;T Inc. </TITLE>\
+                    <p>FORM&nbsp;<b>10-Q</b></p></HTML>";
+        let doc = parse_html(html).unwrap();
+        assert_eq!(doc.title.as_deref(), Some("AT&T Inc."));
+        assert_eq!(doc.form_type, "10-Q");
+    }
+
+    #[test]
+    fn test_parse_html_form_beyond_prefix() {
+        let html = format!("<html><body>{}<p>FORM 8-K</p></body></html>", "x ".repeat(20_000));
+        assert_eq!(parse_html(&html).unwrap().form_type, "8-K");
+    }
+
+    #[test]
+    fn test_parse_html_without_form_errors() {
+        assert!(parse_html("<html><body>No form type here</body></html>").is_err());
+    }
+
+    #[test]
+    fn test_parse_json_from_str_and_bytes() {
+        let json = r#"{"submissionType": "8-K", "entityName": "Test Company", "facts": {}}"#;
+        let from_str = parse_json(json).unwrap();
+        let from_bytes = parse_json(json.as_bytes()).unwrap();
+        assert_eq!(from_str, from_bytes);
+        assert_eq!(from_str.form_type, "8-K");
+        assert_eq!(from_str.title.as_deref(), Some("Test Company"));
+    }
+
+    #[test]
+    fn test_parse_json_invalid() {
+        assert!(matches!(parse_json(r#"{"invalid": json"#), Err(Error::JsonError(_))));
+    }
+
+    #[test]
+    fn test_parse_json_escaped_strings() {
+        let doc = parse_json(r#"{"submissionType": "10-K", "entityName": "A \"B\" C"}"#).unwrap();
+        assert_eq!(doc.title.as_deref(), Some("A \"B\" C"));
+    }
+
+    #[test]
+    fn test_parse_auto_detects_formats() {
+        assert_eq!(parse_auto(r#"{"submissionType": "10-K"}"#).unwrap().format, Format::Json);
+        assert_eq!(
+            parse_auto("<!DOCTYPE html><html><body>FORM 10-Q</body></html>").unwrap().format,
+            Format::Html
+        );
+        let text = parse_auto("CONFORMED SUBMISSION TYPE: 10-Q\nPUBLIC DOCUMENT COUNT: 50").unwrap();
+        assert_eq!(text.format, Format::Text);
+        assert_eq!(text.form_type, "10-Q");
+    }
+
+    #[test]
+    fn test_detect_format_peek() {
+        assert_eq!(detect_format("\u{feff}\n [1]"), Format::Json);
+        assert_eq!(detect_format("\n<html><body></body></html>"), Format::Html);
+        assert_eq!(detect_format("<SEC-DOCUMENT>\nCONFORMED SUBMISSION TYPE: 8-K"), Format::Text);
+        assert_eq!(detect_format("FORM 10-K"), Format::Text);
+        assert_eq!(detect_format(""), Format::Text);
+    }
+
+    #[test]
+    fn test_detect_format_hint_outside_prefix() {
+        let late = format!("<div>{}</div><html></html>", " ".repeat(HTML_HINT_PREFIX));
+        assert_eq!(detect_format(&late), Format::Text);
+    }
+
+    #[test]
+    fn test_parse_auto_malformed_json_errors() {
+        assert!(matches!(parse_auto("{not json"), Err(Error::JsonError(_))));
+    }
+
+    #[test]
+    fn test_parse_auto_bytes_matches_str() {
+        for doc in [
+            r#"{"submissionType": "10-K"}"#,
+            "<!DOCTYPE html><html><body>FORM 10-Q</body></html>",
+            "CONFORMED SUBMISSION TYPE: 8-K",
+        ] {
+            assert_eq!(parse_auto_bytes(doc.as_bytes()).unwrap(), parse_auto(doc).unwrap());
+        }
+        assert!(matches!(parse_auto_bytes(b"FORM 10-K \xFF"), Err(Error::ParseError(_))));
+    }
+
+    #[test]
+    fn test_format_display() {
+        assert_eq!(Format::Html.to_string(), "HTML");
+        assert_eq!(Format::Text.as_str(), "Text");
+    }
+}
@@ -9,11 +9,17 @@
 /// aapl\t320193
 /// msft\t789019
 /// ```
+///
+/// The file is downloaded at most once per day: it is kept in memory as a
+/// sorted index (binary-searched per lookup) and mirrored to
+/// `$SEC_O3_CACHE_DIR`, `$XDG_CACHE_HOME/sec_o3` or `~/.cache/sec_o3` so new
+/// processes can skip the download.
 use ahash::RandomState;
 use futures::StreamExt;
 use moka::future::Cache;
 use once_cell::sync::Lazy;
-use std::collections::HashMap;
+use std::path::{Path, PathBuf};
+use std::sync::Arc;
 use std::time::Duration;
 
 use crate::{Client, Error, Result};
@@ -27,18 +33,152 @@ pub type LazyCache = Lazy<Cache<String, String, RandomState>>;
 static CACHE: LazyCache = Lazy::new(|| {
     Cache::builder()
         .max_capacity(15_000)
-        .time_to_live(Duration::from_secs(3600 * 24))
+        .time_to_live(TICKER_TTL)
         .build_with_hasher(RandomState::default())
 });
 
+const TICKER_URL: &str = "https://www.sec.gov/include/ticker.txt"; // TODO: CHANGE THIS TO exchange.json
+
+/// How long the downloaded ticker list stays fresh, in memory and on disk.
+const TICKER_TTL: Duration = Duration::from_secs(3600 * 24);
+
+/// The full ticker index; a single entry so concurrent misses share one load.
+static INDEX: Lazy<Cache<(), Arc<TickerIndex>>> =
+    Lazy::new(|| Cache::builder().max_capacity(1).time_to_live(TICKER_TTL).build());
+
+/// Client shared by the module-level lookups, so repeated ticker fetches reuse
+/// pooled connections and a single rate limiter.
+static CLIENT: Lazy<Client> = Lazy::new(|| {
+    Client::from_env().unwrap_or_else(|_| Client::new("sec_o3", "default@example.com"))
+});
+
 /// Ticker entry from ticker.txt (tab-delimited: ticker\tcik)
 #[derive(Debug, Clone)]
 struct TickerEntry {
-    #[allow(dead_code)]
     ticker: String,
     cik: String,
 }
 
+/// Ticker entries sorted by upper-cased ticker.
+#[derive(Debug)]
+struct TickerIndex {
+    entries: Vec<TickerEntry>,
+}
+
+impl TickerIndex {
+    /// Parse ticker.txt, skipping malformed lines.
+    fn parse(text: &str) -> Result<Self> {
+        let mut entries: Vec<TickerEntry> = text
+            .lines()
+            .filter_map(|line| {
+                let (ticker, cik) = line.trim().split_once('\t')?;
+                // Parse CIK as number to validate, then format with leading zeros
+                let cik_num = cik.trim().parse::<u64>().ok()?;
+                Some(TickerEntry {
+                    ticker: ticker.trim().to_uppercase(),
+                    cik: format!("{:010}", cik_num),
+                })
+            })
+            .collect();
+
+        if entries.is_empty() {
+            return Err(Error::Custom("Empty ticker data received".to_string()));
+        }
+
+        entries.sort_by(|a, b| a.ticker.cmp(&b.ticker));
+        entries.dedup_by(|a, b| a.ticker == b.ticker);
+        Ok(Self { entries })
+    }
+
+    /// Binary-search for an upper-cased ticker.
+    fn get(&self, ticker: &str) -> Option<&str> {
+        self.entries
+            .binary_search_by(|entry| entry.ticker.as_str().cmp(ticker))
+            .ok()
+            .map(|i| self.entries[i].cik.as_str())
+    }
+}
+
+/// Number of digits in a zero-padded CIK.
+pub const CIK_LEN: usize = 10;
+
+/// Normalize a CIK to its 10-digit zero-padded form.
+///
+/// Accepts an optional case-insensitive `CIK` prefix and `-`/whitespace
+/// separators. Works directly on the ASCII bytes with a fixed stack buffer:
+/// no integer round-trip and a single allocation for the result.
+///
+/// # Errors
+///
+/// Returns `Error::InvalidCik` if the input has no digits, contains other
+/// characters, or has more than 10 significant digits.
+///
+/// # Examples
+///
+/// ```
+/// use sec_o3::utils::cik::normalize_cik;
+///
+/// assert_eq!(normalize_cik("320193").unwrap(), "0000320193");
+/// assert_eq!(normalize_cik("CIK-320193").unwrap(), "0000320193");
+/// assert!(normalize_cik("AAPL").is_err());
+/// ```
+pub fn normalize_cik(cik: &str) -> Result<String> {
+    let trimmed = cik.trim();
+    let body = match trimmed.get(..3) {
+        Some(prefix) if prefix.eq_ignore_ascii_case("CIK") => &trimmed[3..],
+        _ => trimmed,
+    };
+
+    let mut sig = [0u8; CIK_LEN];
+    let mut len = 0;
+    let mut seen_digit = false;
+
+    for b in body.bytes() {
+        match b {
+            b'0' if len == 0 => seen_digit = true,
+            b'0'..=b'9' => {
+                if len == CIK_LEN {
+                    return Err(Error::InvalidCik(format!("{} (more than 10 digits)", cik)));
+                }
+                sig[len] = b;
+                len += 1;
+                seen_digit = true;
+            }
+            b'-' | b' ' | b'\t' => {}
+            _ => return Err(Error::InvalidCik(cik.to_string())),
+        }
+    }
+
+    if !seen_digit {
+        return Err(Error::InvalidCik(cik.to_string()));
+    }
+
+    let mut out = [b'0'; CIK_LEN];
+    out[CIK_LEN - len..].copy_from_slice(&sig[..len]);
+    Ok(String::from_utf8(out.to_vec()).expect("CIK buffer is ASCII digits"))
+}
+
+/// Normalize many CIKs at once.
+///
+/// Lets bulk callers (e.g. the Python binding) cross the FFI boundary once
+/// per list instead of once per CIK.
+///
+/// # Errors
+///
+/// Returns `Error::InvalidCik` for the first invalid entry.
+///
+/// # Examples
+///
+/// ```
+/// use sec_o3::utils::cik::normalize_cik_batch;
+///
+/// let ciks = normalize_cik_batch(&["320193", "CIK789019"]).unwrap();
+/// assert_eq!(ciks, vec!["0000320193", "0000789019"]);
+/// ```
+pub fn normalize_cik_batch<S: AsRef<str>>(ciks: &[S]) -> Result<Vec<String>> {
+    ciks.iter().map(|cik| normalize_cik(cik.as_ref())).collect()
+}
+
 /// Look up CIK by ticker symbol (case-insensitive).
 ///
 /// Returns 10-digit zero-padded CIK string. Cache auto-invalidates after 24 hours.
@@ -118,75 +258,86 @@ pub async fn batch_ticker_lookup(tickers: &[&str]) -> Result<Vec<(String, String
 /// }
 /// ```
 pub async fn populate_cache() -> Result<()> {
-    let data = fetch_ticker_data().await?;
+    let index = ticker_index().await?;
 
-    futures::stream::iter(data)
-        .for_each_concurrent(None, |(ticker, entry)| async move {
-            CACHE.insert(ticker, entry.cik).await;
+    futures::stream::iter(index.entries.iter())
+        .for_each_concurrent(None, |entry| async move {
+            CACHE.insert(entry.ticker.clone(), entry.cik.clone()).await;
         })
         .await;
 
     Ok(())
 }
 
-/// Fetch CIK for a single ticker from the SEC endpoint.
+/// Fetch CIK for a single (upper-cased) ticker from the ticker index.
 async fn fetch_cik_by_ticker(ticker: &str) -> Result<String> {
-    let data = fetch_ticker_data().await?;
-
-    // Lookup ticker
-    data.get(&ticker.to_uppercase())
-        .map(|entry| entry.cik.clone())
+    ticker_index()
+        .await?
+        .get(ticker)
+        .map(str::to_owned)
         .ok_or_else(|| Error::NotFound(format!("Ticker not found: {}", ticker)))
 }
 
-/// Fetch and parse the complete ticker-to-CIK mapping from SEC.
-///
-/// The SEC provides this as a tab-delimited text file with format:
-/// ticker\tcik (e.g., "aapl\t320193")
-async fn fetch_ticker_data() -> Result<HashMap<String, TickerEntry>> {
-    let client = Client::from_env().unwrap_or_else(|_| Client::new("sec_o3", "default@example.com"));
-
-    let url = "https://www.sec.gov/include/ticker.txt"; // TODO: CHANGE THIS TO exchange.json
-
-    let text = client
-        .get_text(url)
+/// Shared ticker index, loaded at most once per TTL.
+async fn ticker_index() -> Result<Arc<TickerIndex>> {
+    INDEX
+        .try_get_with((), async { load_ticker_index().await.map(Arc::new) })
         .await
-        .map_err(|e| Error::Custom(format!("Failed to fetch ticker data: {}", e)))?;
+        .map_err(|e| Error::Custom(format!("Failed to fetch ticker data: {}", e)))
+}
 
-    let mut data = HashMap::new();
+/// Build the ticker index from the on-disk copy if fresh, else from the SEC.
+async fn load_ticker_index() -> Result<TickerIndex> {
+    let path = disk_cache_path();
 
-    for line in text.lines() {
-        let line = line.trim();
-        if line.is_empty() {
-            continue;
+    if let Some(path) = &path {
+        if let Some(index) = read_fresh(path).await.and_then(|text| TickerIndex::parse(&text).ok()) {
+            return Ok(index);
         }
+    }
 
-        // Parse tab-delimited: ticker\tcik
-        let parts: Vec<&str> = line.split('\t').collect();
-        if parts.len() != 2 {
-            continue; // Skip malformed lines
-        }
+    let text = CLIENT.get_text(TICKER_URL).await?;
+    let index = TickerIndex::parse(&text)?;
 
-        let ticker = parts[0].trim().to_uppercase();
-        let cik = parts[1].trim();
+    if let Some(path) = &path {
+        write_cache(path, &text).await;
+    }
+    Ok(index)
+}
 
-        // Parse CIK as number to validate, then format with leading zeros
-        if let Ok(cik_num) = cik.parse::<u64>() {
-            data.insert(
-                ticker.clone(),
-                TickerEntry {
-                    ticker: ticker.clone(),
-                    cik: format!("{:010}", cik_num),
-                },
-            );
-        }
+/// Location of the on-disk ticker.txt copy, if a cache directory is known.
+fn disk_cache_path() -> Option<PathBuf> {
+    let dir = std::env::var_os("SEC_O3_CACHE_DIR")
+        .map(PathBuf::from)
+        .or_else(|| std::env::var_os("XDG_CACHE_HOME").map(|d| PathBuf::from(d).join("sec_o3")))
+        .or_else(|| std::env::var_os("HOME").map(|h| PathBuf::from(h).join(".cache/sec_o3")))?;
+    Some(dir.join("ticker.txt"))
+}
+
+/// Read `path` if it was written within the TTL.
+async fn read_fresh(path: &Path) -> Option<String> {
+    let modified = tokio::fs::metadata(path).await.ok()?.modified().ok()?;
+    if modified.elapsed().ok()? > TICKER_TTL {
+        return None;
     }
+    tokio::fs::read_to_string(path).await.ok()
+}
 
-    if data.is_empty() {
-        return Err(Error::Custom("Empty ticker data received".to_string()));
+/// Best-effort atomic write; a failure only means the next process downloads again.
+async fn write_cache(path: &Path, text: &str) {
+    let tmp = path.with_extension("tmp");
+    let result: std::io::Result<()> = async {
+        if let Some(dir) = path.parent() {
+            tokio::fs::create_dir_all(dir).await?;
+        }
+        tokio::fs::write(&tmp, text).await?;
+        tokio::fs::rename(&tmp, path).await
     }
+    .await;
 
-    Ok(data)
+    if let Err(e) = result {
+        tracing::debug!("Could not cache ticker data at {}: {}", path.display(), e);
+    }
 }
 
 /// Get the current cache size (for debugging/monitoring).
@@ -197,12 +348,42 @@ pub fn cache_size() -> u64 {
 /// Clear the cache (for testing or if you want to force a refresh).
 pub async fn clear_cache() {
     CACHE.invalidate_all();
+    INDEX.invalidate_all();
 }
 
 #[cfg(test)]
 mod tests {
     use super::*;
 
+    #[test]
+    fn test_normalize_cik_formats() {
+        assert_eq!(normalize_cik("320193").unwrap(), "0000320193");
+        assert_eq!(normalize_cik("0000320193").unwrap(), "0000320193");
+        assert_eq!(normalize_cik("1").unwrap(), "0000000001");
+        assert_eq!(normalize_cik("CIK0000320193").unwrap(), "0000320193");
+        assert_eq!(normalize_cik("cik-320193").unwrap(), "0000320193");
+        assert_eq!(normalize_cik("0000-320193").unwrap(), "0000320193");
+        assert_eq!(normalize_cik("9999999999").unwrap(), "9999999999");
+    }
+
+    #[test]
+    fn test_normalize_cik_invalid() {
+        assert!(normalize_cik("").is_err());
+        assert!(normalize_cik("CIK").is_err());
+        assert!(normalize_cik("AAPL").is_err());
+        assert!(normalize_cik("12345678901").is_err());
+    }
+
+    #[test]
+    fn test_ticker_index_parse_and_lookup() {
+        let index = TickerIndex::parse("msft\t789019\naapl\t320193\nbad line\nx\tnotanumber\n").unwrap();
+        assert_eq!(index.entries.len(), 2);
+        assert_eq!(index.get("AAPL"), Some("0000320193"));
+        assert_eq!(index.get("MSFT"), Some("0000789019"));
+        assert_eq!(index.get("GOOGL"), None);
+        assert!(TickerIndex::parse("\n\n").is_err());
+    }
+
     #[tokio::test]
     async fn test_ticker_to_cik() {
         let cik = ticker_to_cik("AAPL").await.unwrap();
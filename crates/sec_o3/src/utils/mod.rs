@@ -9,7 +9,7 @@
 /// support consistent string formatting and data access patterns.
 ///
 pub mod cik;
-pub use cik::{batch_ticker_lookup, ticker_to_cik};
+pub use cik::{batch_ticker_lookup, normalize_cik, normalize_cik_batch, ticker_to_cik};
 
 use crate::{Error, Result};
 use chrono::{DateTime, Utc};
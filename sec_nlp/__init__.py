@@ -1,30 +1,46 @@
-# sec_nlp/__init__.py
 """SEC NLP - CLI tool for SEC filing analysis."""
 
-from importlib.metadata import PackageNotFoundError
-from importlib.metadata import version as _pkg_version
-
-try:
-    __version__ = _pkg_version("sec_nlp")
-except PackageNotFoundError:
-    __version__ = "0.0.0"
-
-from sec_nlp.core import (
-    FilingManager,
-    FilingMode,
-    Pipeline,
-    Preprocessor,
-    get_logger,
-    settings,
-    setup_logging,
-)
-from sec_nlp.core.llm import (
-    SummarizationInput,
-    SummarizationOutput,
-    build_hf_pipeline,
-    build_ollama_llm,
-    build_summarization_runnable,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from sec_nlp._version import __version__
+
+if TYPE_CHECKING:
+    from sec_nlp.core import (
+        FilingManager,
+        FilingMode,
+        Pipeline,
+        Preprocessor,
+        get_logger,
+        settings,
+        setup_logging,
+    )
+    from sec_nlp.core.llm import (
+        SummarizationInput,
+        SummarizationOutput,
+        build_hf_pipeline,
+        build_ollama_llm,
+        build_summarization_runnable,
+    )
+
+# Public name -> defining module. Resolved on first attribute access (PEP 562)
+# so `import sec_nlp` does not pull in torch, transformers or langchain.
+_LAZY: dict[str, str] = {
+    "Pipeline": "sec_nlp.core.pipeline",
+    "FilingManager": "sec_nlp.core.downloader",
+    "Preprocessor": "sec_nlp.core.preprocessor",
+    "FilingMode": "sec_nlp.core.enums",
+    "settings": "sec_nlp.core.config",
+    "get_logger": "sec_nlp.core.config",
+    "setup_logging": "sec_nlp.core.config",
+    "build_hf_pipeline": "sec_nlp.core.llm.hf",
+    "build_ollama_llm": "sec_nlp.core.llm.ollama",
+    "SummarizationInput": "sec_nlp.core.llm.chains",
+    "SummarizationOutput": "sec_nlp.core.llm.chains",
+    "build_summarization_runnable": "sec_nlp.core.llm.chains",
+}
 
 __all__: list[str] = [
     "__version__",
@@ -38,10 +54,23 @@ __all__: list[str] = [
     "get_logger",
     "setup_logging",
     # LLM
-    "LocalLLMBase",
-    "FlanT5LocalLLM",
+    "build_hf_pipeline",
     "build_ollama_llm",
     "SummarizationInput",
     "SummarizationOutput",
     "build_summarization_runnable",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,8 @@
+"""Package version.
+
+A static constant rather than an ``importlib.metadata`` lookup, which scans
+distribution metadata on ``sys.path`` and shows up in CLI cold start.
+Keep in sync with ``[project].version`` in pyproject.toml.
+"""
+
+__version__ = "0.1.0"
@@ -4,6 +4,7 @@ from __future__ import annotations
 import argparse
 import shutil
 import time
+from collections.abc import Sequence
 from datetime import date, datetime, timedelta
 from pathlib import Path
 
@@ -21,7 +22,7 @@ from sec_nlp.core import (
 logger = get_logger(__name__)
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     today = datetime.today()
     one_year_ago = today - timedelta(days=365)
 
@@ -37,6 +38,19 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--max-new-tokens", type=int, default=1024)
     p.add_argument("--max-retries", type=int, default=2)
     p.add_argument("--batch-size", type=int, default=16)
+    p.add_argument(
+        "--quantization",
+        choices=["none", "auto", "int8", "nf4", "bf16", "fp16"],
+        default="none",
+        help="Local model weight precision (auto picks bf16 where supported)",
+    )
+    p.add_argument("--compile", action="store_true", help="torch.compile the local model")
+    p.add_argument(
+        "--backend",
+        choices=["torch", "onnx"],
+        default="torch",
+        help="Local model runtime (onnx requires optimum[onnxruntime])",
+    )
     p.add_argument("--no-require-json", action="store_true")
     p.add_argument("--fresh", action="store_true")
     p.add_argument("--no-cleanup", action="store_true")
@@ -44,7 +58,7 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--dry-run", action="store_true")
     p.add_argument("--log-format", choices=["simple", "detailed", "json"])
     p.add_argument("--log-file", type=Path, help="Write logs to file")
-    return p.parse_args()
+    return p.parse_args(argv)
 
 
 def setup_folders(fresh: bool) -> tuple[Path, Path]:
@@ -76,10 +90,11 @@ def cleanup_downloads(downloads_folder: Path) -> None:
         logger.error("Cleanup failed: %s: %s", type(e).__name__, e)
 
 
-def main() -> None:
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the CLI; `argv` defaults to `sys.argv[1:]`."""
     load_dotenv()
 
-    args = parse_args()
+    args = parse_args(argv)
 
     setup_logging(
         level="DEBUG" if args.verbose else None,
@@ -116,6 +131,9 @@ def main() -> None:
         require_json=not args.no_require_json,
         max_retries=args.max_retries,
         batch_size=args.batch_size,
+        quantization=args.quantization,
+        compile_llm=args.compile,
+        llm_backend=args.backend,
         dry_run=args.dry_run,
     )
 
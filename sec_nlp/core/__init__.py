@@ -1,11 +1,30 @@
 # sec_nlp/core/__init__.py
 """Core functionality for SEC NLP."""
 
-from sec_nlp.core.config import get_logger, settings, setup_logging
-from sec_nlp.core.downloader import FilingManager
-from sec_nlp.core.enums import FilingMode
-from sec_nlp.core.pipeline import Pipeline, default_prompt_path
-from sec_nlp.core.preprocessor import Preprocessor
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from sec_nlp.core.config import get_logger, settings, setup_logging
+    from sec_nlp.core.downloader import FilingManager
+    from sec_nlp.core.enums import FilingMode
+    from sec_nlp.core.pipeline import Pipeline, default_prompt_path
+    from sec_nlp.core.preprocessor import Preprocessor
+
+# Loaded on first access so importing a single submodule (e.g. the CLI pulling
+# in sec_nlp.core.config) does not also import the pipeline's model stack.
+_LAZY: dict[str, str] = {
+    "FilingMode": "sec_nlp.core.enums",
+    "Pipeline": "sec_nlp.core.pipeline",
+    "default_prompt_path": "sec_nlp.core.pipeline",
+    "Preprocessor": "sec_nlp.core.preprocessor",
+    "FilingManager": "sec_nlp.core.downloader",
+    "get_logger": "sec_nlp.core.config",
+    "settings": "sec_nlp.core.config",
+    "setup_logging": "sec_nlp.core.config",
+}
 
 __all__: list[str] = [
     "FilingMode",
@@ -17,3 +36,17 @@ __all__: list[str] = [
     "settings",
     "setup_logging",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
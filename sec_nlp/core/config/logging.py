@@ -6,9 +6,15 @@ from __future__ import annotations
 import logging
 import sys
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
-from sec_nlp.core.config.settings import settings
+from sec_nlp.core.config.settings import _get_settings
+
+# Third-party loggers held at WARNING
+_NOISY: tuple[str, ...] = ("urllib3", "requests", "transformers", "torch", "httpx")
+
+# Resolved arguments and installed handlers of the last setup_logging call
+_CONFIGURED: tuple[tuple[Any, ...], tuple[logging.Handler, ...]] | None = None
 
 
 class ColoredFormatter(logging.Formatter):
@@ -23,12 +29,25 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = "\033[0m"
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._level_cache: dict[str, str] = {
+            name: color + name + self.RESET for name, color in self.COLORS.items()
+        }
+
     def format(self, record: logging.LogRecord) -> str:
         """Add color to log level."""
         levelname = record.levelname
-        if levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[levelname]}{levelname}{self.RESET}"
-        return super().format(record)
+        colored = self._level_cache.get(levelname)
+        if colored is None:
+            return super().format(record)
+
+        # Restore afterwards so other handlers never see the escape codes
+        record.levelname = colored
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
 def setup_logging(
@@ -57,6 +76,8 @@ def setup_logging(
         setup_logging(log_file="logs/app.log")
     """
 
+    settings = _get_settings()
+
     # Determine log level
     if level is None:
         level = settings.log_level
@@ -67,6 +88,15 @@ def setup_logging(
     if format_type is None:
         format_type = settings.log_format
 
+    # Repeat calls with the same arguments are no-ops while our handlers are installed
+    global _CONFIGURED
+    root_logger = logging.getLogger()
+    key = (level, format_type, str(log_file) if log_file else None, enable_colors)
+    if _CONFIGURED is not None:
+        prev_key, prev_handlers = _CONFIGURED
+        if prev_key == key and all(h in root_logger.handlers for h in prev_handlers):
+            return
+
     # Format strings
     formats: dict[str, str] = {
         "simple": "%(levelname)s - %(message)s",
@@ -84,10 +114,12 @@ def setup_logging(
     )
 
     # Configure root logger
-    root_logger = logging.getLogger()
     root_logger.setLevel(level)
 
-    # Remove existing handlers
+    # Remove existing handlers, closing any file handlers we opened before
+    if _CONFIGURED is not None:
+        for handler in _CONFIGURED[1]:
+            handler.close()
     root_logger.handlers.clear()
 
     # Console handler
@@ -109,11 +141,10 @@ def setup_logging(
         root_logger.addHandler(file_handler)
 
     # Suppress noisy third-party loggers
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
-    logging.getLogger("requests").setLevel(logging.WARNING)
-    logging.getLogger("transformers").setLevel(logging.WARNING)
-    logging.getLogger("torch").setLevel(logging.WARNING)
-    logging.getLogger("httpx").setLevel(logging.WARNING)
+    for name in _NOISY:
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    _CONFIGURED = (key, tuple(root_logger.handlers))
 
     root_logger.info(
         "Logging configured: level=%s, format=%s, file=%s",
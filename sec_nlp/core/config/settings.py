@@ -5,7 +5,7 @@ from __future__ import annotations
 
 from functools import lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal, cast
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -19,6 +19,9 @@ class Settings(BaseSettings):
         from sec_nlp.core.config import settings
 
         print(settings.email)
+
+    The `settings` singleton is built on first attribute access, so
+    importing this module does not read .env or validate anything.
     """
 
     model_config = SettingsConfigDict(
@@ -34,6 +37,12 @@ class Settings(BaseSettings):
         description="Email for SEC EDGAR API (required by SEC)",
         alias="email",
     )
+    sec_rate_limit: int = Field(
+        default=10,
+        description="Maximum concurrent SEC EDGAR downloads (SEC allows ~10 requests/s)",
+        ge=1,
+        alias="sec_rate_limit",
+    )
 
     # Qdrant Vector Database
     qdrant_host: str = Field(
@@ -102,6 +111,18 @@ class Settings(BaseSettings):
         ge=1,
         alias="qdrant_write_consistency_factor",
     )
+    qdrant_upsert_batch_size: int = Field(
+        default=256,
+        description="Maximum number of points sent per Qdrant upsert request",
+        ge=1,
+        alias="qdrant_upsert_batch_size",
+    )
+    qdrant_upsert_parallelism: int = Field(
+        default=4,
+        description="Number of Qdrant upsert requests kept in flight concurrently",
+        ge=1,
+        alias="qdrant_upsert_parallelism",
+    )
 
     embedding_model: str = Field(
         default="sentence-transformers/all-MiniLM-L6-v2",
@@ -117,6 +138,14 @@ class Settings(BaseSettings):
         ge=1,
         alias="embedding_batch_size",
     )
+    embedding_backend: Literal["torch", "onnx", "onnx-int8"] = Field(
+        default="torch",
+        description=(
+            "Embedding inference backend; onnx-int8 exports a dynamically quantized "
+            "(AVX-512 VNNI) ONNX model once and reuses it from the user cache"
+        ),
+        alias="embedding_backend",
+    )
 
     # Ollama
     ollama_base_url: str = Field(
@@ -127,6 +156,12 @@ class Settings(BaseSettings):
     ollama_timeout: int = Field(
         default=120, description="Ollama request timeout in seconds", ge=1, alias="ollama_timeout"
     )
+    ollama_num_parallel: int = Field(
+        default=4,
+        description="Prompts of one batch sent to the Ollama server concurrently",
+        ge=1,
+        alias="ollama_num_parallel",
+    )
 
     # Hugging Face
     hf_cache: Path | None = Field(
@@ -197,5 +232,19 @@ def _get_settings() -> Settings:
     return Settings()
 
 
-# Singleton instance for convenient import
-settings = _get_settings()
+class _LazySettings:
+    """Stand-in for the singleton that builds it on first attribute access."""
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(_get_settings(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(_get_settings(), name, value)
+
+    def __repr__(self) -> str:
+        return repr(_get_settings())
+
+
+# Singleton for convenient import; commands that never touch settings
+# (e.g. `--help`) skip reading .env and validation
+settings: Settings = cast("Settings", _LazySettings())
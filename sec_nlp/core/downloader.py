@@ -1,47 +1,56 @@
 # sec_nlp/core/downloader.py
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
-from typing import Any
 
-from pydantic import BaseModel, PrivateAttr, field_validator
 from sec_edgar_downloader import Downloader as SecEdgarDownloader  # type: ignore
 from tqdm import tqdm
 
-from sec_nlp.core.config import get_logger
+from sec_nlp.core.config import get_logger, settings
 from sec_nlp.core.enums import FilingMode
 
 logger = get_logger(__name__)
 
 
-class FilingManager(BaseModel):
+@dataclass(slots=True, eq=False)
+class FilingManager:
     """
     Downloads SEC filings for provided ticker symbols.
+
+    A plain slotted dataclass: it only wraps the EDGAR client, so it needs no
+    validation beyond coercing and creating the downloads folder.
     """
 
     email: str
     downloads_folder: Path
     company_name: str = "My Company Inc."
 
-    _symbols: set[str] = PrivateAttr(default_factory=set)
-    _downloader: SecEdgarDownloader | None = PrivateAttr(default=None)
-
-    @field_validator("downloads_folder")
-    @classmethod
-    def _ensure_folder(cls, v: Path) -> Path:
-        v.mkdir(parents=True, exist_ok=True)
-        return v
+    _symbols: set[str] = field(default_factory=set, init=False)
+    _sorted: tuple[str, ...] | None = field(default=None, init=False)
+    _downloader: SecEdgarDownloader | None = field(default=None, init=False)
 
-    def model_post_init(self, __ctx: Any) -> None:
+    def __post_init__(self) -> None:
+        self.downloads_folder = Path(self.downloads_folder)
+        self.downloads_folder.mkdir(parents=True, exist_ok=True)
         self._downloader = SecEdgarDownloader(
             self.company_name, self.email, str(self.downloads_folder)
         )
 
     def add_symbol(self, symbol: str) -> None:
-        self._symbols.add(symbol.strip().upper())
+        self.add_symbols([symbol])
 
     def add_symbols(self, symbols: list[str]) -> None:
-        for s in symbols:
-            self.add_symbol(s)
+        """Register symbols, normalized to upper case; blank entries are skipped."""
+        self._symbols.update(t for s in symbols if (t := s.strip().upper()))
+        self._sorted = None
+
+    def _sorted_symbols(self) -> tuple[str, ...]:
+        """Registered symbols in order, sorted once per change to the set."""
+        if self._sorted is None:
+            self._sorted = tuple(sorted(self._symbols))
+        return self._sorted
 
     def download_filings(
         self,
@@ -52,6 +61,10 @@ class FilingManager(BaseModel):
         """
         Download filings for all added symbols within optional date range.
 
+        Symbols are fetched concurrently on up to `settings.sec_rate_limit`
+        threads; the EDGAR client's own limiter keeps requests within SEC's
+        rate limit.
+
         Args:
             mode: FilingMode.annual.form -> "10-K", FilingMode.quarterly.form -> "10-Q"
         """
@@ -69,23 +82,55 @@ class FilingManager(BaseModel):
             mode.value,
         )
 
-        for symbol in tqdm(sorted(self._symbols), desc=f"Downloading {filing_type} files..."):
-            try:
-                self._downloader.get(  # type: ignore[union-attr]
-                    filing_type,
-                    symbol,
-                    after=start_date,
-                    before=end_date,
-                    download_details=True,
-                )
-                results[symbol] = True
-            except Exception:
-                results[symbol] = False
-
-        return results
+        symbols = self._sorted_symbols()
+        workers = min(settings.sec_rate_limit, len(symbols))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="edgar") as pool:
+            futures = {
+                pool.submit(self.download_symbol, symbol, mode, start_date, end_date): symbol
+                for symbol in symbols
+            }
+            progress = tqdm(
+                as_completed(futures),
+                total=len(futures),
+                desc=f"Downloading {filing_type} files...",
+                # Downloads take seconds each; redraw rarely and skip the bar in logs
+                mininterval=1.0,
+                smoothing=0,
+                disable=not sys.stderr.isatty(),
+            )
+            for future in progress:
+                results[futures[future]] = future.result()
+
+        return {symbol: results[symbol] for symbol in symbols}
+
+    def download_symbol(
+        self,
+        symbol: str,
+        mode: FilingMode = FilingMode.annual,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> bool:
+        """
+        Download filings for one symbol, returning whether it succeeded.
+
+        Safe to call from several threads on one manager, so concurrent
+        downloads share a single EDGAR client (and its ticker -> CIK map).
+        """
+        try:
+            self._downloader.get(  # type: ignore[union-attr]
+                mode.form,
+                symbol.strip().upper(),
+                after=start_date,
+                before=end_date,
+                download_details=True,
+            )
+            return True
+        except Exception:
+            logger.exception("Failed to download %s filings for %s", mode.form, symbol)
+            return False
 
     def __repr__(self) -> str:
-        symbols = ",".join(sorted(self._symbols)) or "<none>"
+        symbols = ",".join(self._sorted_symbols()) or "<none>"
         return f"<FilingManager company_name={self.company_name} symbols=[{symbols}] downloads_folder={self.downloads_folder!r}>"
 
     def __str__(self) -> str:
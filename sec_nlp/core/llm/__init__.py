@@ -1,13 +1,28 @@
 # sec_nlp/corellm/__init__.py
 """Langchain LLM integrations."""
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from sec_nlp.core.llm.chains import (
     SummarizationInput,
     SummarizationOutput,
+    build_summarization_batch_fn,
     build_summarization_runnable,
 )
-from sec_nlp.core.llm.hf import build_hf_pipeline
-from sec_nlp.core.llm.ollama import build_ollama_llm
+
+if TYPE_CHECKING:
+    from sec_nlp.core.llm.hf import build_hf_pipeline
+    from sec_nlp.core.llm.ollama import build_ollama_llm
+
+# Backends are loaded on first access so using one (e.g. Ollama over HTTP)
+# does not import the other's dependencies (langchain_huggingface, transformers)
+_LAZY: dict[str, str] = {
+    "build_hf_pipeline": "sec_nlp.core.llm.hf",
+    "build_ollama_llm": "sec_nlp.core.llm.ollama",
+}
 
 __all__: list[str] = [
     "build_hf_pipeline",
@@ -15,4 +30,19 @@ __all__: list[str] = [
     "SummarizationInput",
     "SummarizationOutput",
     "build_summarization_runnable",
+    "build_summarization_batch_fn",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
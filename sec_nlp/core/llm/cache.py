@@ -0,0 +1,99 @@
+"""On-disk cache for LLM chunk summaries."""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from collections import OrderedDict
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from sec_nlp.core.config import get_logger
+
+logger = get_logger(__name__)
+
+__all__: list[str] = ["SummaryCache"]
+
+# Stay below SQLITE_MAX_VARIABLE_NUMBER on older SQLite builds
+_SQL_BATCH = 500
+# Bound on in-memory entries kept in front of SQLite; oldest are evicted first
+_MEMORY_MAX = 4096
+
+
+class SummaryCache:
+    """
+    SQLite-backed store of summary payloads keyed by content hash.
+
+    Filings repeat a lot of boilerplate (risk factors, safe-harbor text), so
+    keying on the prompt fingerprint plus the chunk inputs lets identical
+    chunks across symbols, quarters and reruns skip the LLM entirely.
+
+    Usage:
+        cache = SummaryCache(out_path / "summary_cache.sqlite")
+        key = SummaryCache.make_key(prompt_hash, symbol, keyword, chunk)
+        hits = cache.get_many([key])
+    """
+
+    def __init__(self, path: Path, memory_size: int = _MEMORY_MAX) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._memory: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._memory_size = memory_size
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS summaries (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        self._conn.commit()
+        logger.info("Opened summary cache: %s", path)
+
+    @staticmethod
+    def make_key(namespace: str, *parts: str) -> str:
+        """Hash a namespace and ordered parts into a 128-bit hex key."""
+        h = hashlib.blake2b(namespace.encode(), digest_size=16)
+        for part in parts:
+            h.update(b"\x00")
+            h.update(part.encode())
+        return h.hexdigest()
+
+    def get_many(self, keys: list[str]) -> dict[str, dict[str, Any]]:
+        """Return cached payloads for whichever of `keys` are present."""
+        found: dict[str, dict[str, Any]] = {}
+        pending: list[str] = []
+        for key in keys:
+            value = self._memory.get(key)
+            if value is None:
+                pending.append(key)
+            else:
+                self._memory.move_to_end(key)
+                found[key] = value
+
+        for i in range(0, len(pending), _SQL_BATCH):
+            batch = pending[i : i + _SQL_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT key, value FROM summaries WHERE key IN ({placeholders})", batch
+            )
+            for key, value in rows:
+                found[key] = self._remember(key, orjson.loads(value))
+        return found
+
+    def put_many(self, items: Iterable[tuple[str, dict[str, Any]]]) -> None:
+        """Insert or replace payloads and commit once."""
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO summaries (key, value) VALUES (?, ?)",
+            ((key, orjson.dumps(self._remember(key, value)).decode()) for key, value in items),
+        )
+        self._conn.commit()
+
+    def _remember(self, key: str, value: dict[str, Any]) -> dict[str, Any]:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        if len(self._memory) > self._memory_size:
+            self._memory.popitem(last=False)
+        return value
+
+    def close(self) -> None:
+        self._conn.close()
@@ -1,26 +1,40 @@
 # sec_nlp/core/llm/chains.py
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Callable, Sequence
+from functools import cache, lru_cache
+from typing import Any, cast
 
 from langchain_core.exceptions import OutputParserException
 from langchain_core.language_models import BaseLanguageModel
 from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.outputs import Generation
+from langchain_core.prompts import PromptTemplate
 from langchain_core.prompts.base import BasePromptTemplate
 from langchain_core.runnables import Runnable, RunnableSerializable
-from pydantic import BaseModel, Field
-from typing_extensions import override
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from typing_extensions import TypedDict, override
 
 from sec_nlp.core.config import get_logger
 
 logger = get_logger(__name__)
 
 
-__all__: list[str] = ["SummarizationInput", "SummarizationOutput", "build_summarization_runnable"]
+__all__: list[str] = [
+    "SummarizationInput",
+    "SummarizationOutput",
+    "build_summarization_runnable",
+    "build_summarization_batch_fn",
+]
 
 
-class SummarizationInput(BaseModel):
-    """Input schema for the SEC summarization chain."""
+class SummarizationInput(TypedDict):
+    """
+    Input schema for the SEC summarization chain.
+
+    A plain dict at runtime: inputs are built by the pipeline from trusted
+    values and only ever unpacked into the prompt, so they are not validated.
+    """
 
     chunk: str
     symbol: str
@@ -30,6 +44,10 @@ class SummarizationInput(BaseModel):
 class SummarizationOutput(BaseModel):
     """Pydantic dataclass representing a validated LLM summary payload."""
 
+    # Results are never mutated after parsing; instances pass between chain
+    # steps, the batch path and the cache by reference
+    model_config = ConfigDict(frozen=True)
+
     summary: str | None = Field(default=None)
     points: list[str] | None = Field(default=None)
     confidence: float | None = Field(default=None, ge=0.0, le=1.0)
@@ -38,17 +56,47 @@ class SummarizationOutput(BaseModel):
     raw_output: str | None = Field(default=None)
 
 
+@cache
+def _format_instructions(model: type[BaseModel]) -> str:
+    """Render (and memoize) the JSON-schema format instructions for a model."""
+    return PydanticOutputParser(pydantic_object=model).get_format_instructions()
+
+
 class SummarizationOutputParser(PydanticOutputParser[SummarizationOutput]):
     """Output parser to validate and format LLM output."""
 
     pydantic_object: type[SummarizationOutput] = SummarizationOutput
 
     def parse(self, text: str) -> SummarizationOutput:
+        # Bare JSON replies validate straight from the string in pydantic-core;
+        # fenced or malformed output falls through to the markdown-aware path
+        if text.lstrip().startswith("{"):
+            try:
+                return self.pydantic_object.model_validate_json(text)
+            except ValidationError:
+                pass
         try:
-            output: SummarizationOutput = super().parse(text)
-            return output
+            output = super().parse_result([Generation(text=text)])
         except OutputParserException as e:
-            return SummarizationOutput(error=e.observation, raw_output=e.llm_output)
+            # Schema failures carry no observation, only the exception message
+            return SummarizationOutput(error=e.observation or str(e), raw_output=e.llm_output)
+        return cast(SummarizationOutput, output)
+
+    @override
+    def parse_result(
+        self, result: list[Generation], *, partial: bool = False
+    ) -> SummarizationOutput | None:
+        # `prompt | llm | parser` calls this rather than parse(); route complete
+        # results through parse() so the runnable and the batch fn both turn
+        # malformed output into an error payload instead of raising
+        if partial:
+            return super().parse_result(result, partial=True)
+        return self.parse(result[0].text)
+
+    @override
+    def get_format_instructions(self) -> str:
+        # The output schema is static, so render it once per model class
+        return _format_instructions(self.pydantic_object)
 
     @property
     def _type(self) -> str:
@@ -61,6 +109,12 @@ class SummarizationOutputParser(PydanticOutputParser[SummarizationOutput]):
         return self.pydantic_object
 
 
+@lru_cache(maxsize=1)
+def _output_parser() -> SummarizationOutputParser:
+    """Shared parser instance; it holds no per-call state."""
+    return SummarizationOutputParser()
+
+
 def build_summarization_runnable(
     *,
     prompt: BasePromptTemplate[Any],
@@ -74,8 +128,54 @@ def build_summarization_runnable(
       output: SummarizationOutput
     """
 
-    parser = SummarizationOutputParser()
+    parser = _output_parser()
 
     chain: RunnableSerializable[Any, SummarizationOutput] = prompt | llm | parser
 
     return chain.with_types(input_type=SummarizationInput, output_type=SummarizationOutput)
+
+
+def _compile_formatter(prompt: BasePromptTemplate[Any]) -> Callable[..., str]:
+    """
+    Resolve a prompt to the cheapest equivalent `**kwargs -> str` formatter.
+
+    Plain f-string templates are bound to the builtin `str.format` of their
+    template text once, bypassing LangChain's pure-Python `StrictFormatter`
+    and partial-variable merge on every call. Anything else falls back to
+    `prompt.format`.
+    """
+    if (
+        isinstance(prompt, PromptTemplate)
+        and prompt.template_format == "f-string"
+        and not prompt.partial_variables
+    ):
+        return prompt.template.format
+    return prompt.format
+
+
+def build_summarization_batch_fn(
+    *,
+    prompt: BasePromptTemplate[Any],
+    llm: BaseLanguageModel[Any],
+) -> Callable[[Sequence[SummarizationInput]], list[SummarizationOutput]]:
+    """
+    Build a direct batch summarizer equivalent to the runnable's `.batch()`.
+
+    Prompts are formatted in one pass, sent to the LLM in a single batch call
+    and parsed in place, skipping the per-item prompt/parser Runnable dispatch
+    and callback bookkeeping that `RunnableSequence.batch` performs.
+    """
+
+    parser = _output_parser()
+    fmt = _compile_formatter(prompt)
+
+    def summarize_batch(items: Sequence[SummarizationInput]) -> list[SummarizationOutput]:
+        if not items:
+            return []
+        outputs = llm.batch([fmt(**item) for item in items])
+        return [
+            parser.parse(out if isinstance(out, str) else str(getattr(out, "content", out)))
+            for out in outputs
+        ]
+
+    return summarize_batch
@@ -1,16 +1,50 @@
 # sec_nlp/core/llm/ollama.py
 from __future__ import annotations
 
-import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.outputs import LLMResult
 from langchain_ollama.llms import OllamaLLM
 
-from sec_nlp.core.config import get_logger
+from sec_nlp.core.config import get_logger, settings
 
 logger = get_logger(__name__)
 
 
+class _ConcurrentOllamaLLM(OllamaLLM):
+    """OllamaLLM whose batch calls send prompts to the server concurrently."""
+
+    num_parallel: int = 4
+
+    def _generate(
+        self,
+        prompts: list[str],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> LLMResult:
+        # The stock implementation awaits each prompt before sending the next;
+        # the pooled httpx client is thread-safe, so fan the batch out instead
+        if len(prompts) <= 1 or self.num_parallel <= 1:
+            return super()._generate(prompts, stop, run_manager, **kwargs)
+
+        def one(i: int) -> LLMResult:
+            try:
+                # No run manager: it belongs to the first prompt's run, and
+                # concurrent prompts would interleave their token callbacks on it.
+                # Each prompt's run still gets its own start/end callbacks.
+                return OllamaLLM._generate(self, [prompts[i]], stop, None, **kwargs)
+            except Exception as e:
+                e.add_note(f"while generating prompt {i + 1} of {len(prompts)}")
+                raise
+
+        with ThreadPoolExecutor(max_workers=min(self.num_parallel, len(prompts))) as pool:
+            results = list(pool.map(one, range(len(prompts))))
+        return LLMResult(generations=[g for r in results for g in r.generations])
+
+
 def build_ollama_llm(
     model_name: str,
     base_url: str | None = None,
@@ -22,17 +56,24 @@ def build_ollama_llm(
 
     Args:
         model_name: Ollama model name (e.g., "llama3.2", "mistral")
-        base_url: Ollama server URL (defaults to http://localhost:11434)
+        base_url: Ollama server URL (defaults to `settings.ollama_base_url`)
         temperature: Sampling temperature
-        **kwargs: Additional parameters for OllamaLLM
+        **kwargs: Additional parameters for OllamaLLM (e.g. `num_parallel`, the
+            number of prompts per batch in flight, default `settings.ollama_num_parallel`)
 
     Returns:
         OllamaLLM: LLM object that implements <Runnable[str | PromptValue, str]>
     """
 
-    base_url = base_url or os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+    base_url = base_url or settings.ollama_base_url
 
-    llm = OllamaLLM(model=model_name, base_url=base_url, temperature=temperature, **kwargs)
+    # OllamaLLM keeps one pooled httpx client per instance, so building it once
+    # reuses keep-alive connections across every prompt of a run
+    kwargs.setdefault("client_kwargs", {"timeout": settings.ollama_timeout})
+    kwargs.setdefault("num_parallel", settings.ollama_num_parallel)
+    llm = _ConcurrentOllamaLLM(
+        model=model_name, base_url=base_url, temperature=temperature, **kwargs
+    )
 
     logger.info("Created Ollama LLM: model=%s, base_url=%s", model_name, base_url)
     return llm
@@ -1,18 +1,23 @@
 # sec_nlp/core/pipeline.py
 from __future__ import annotations
 
-import json
+import asyncio
+import multiprocessing
 import os
 import re
+import sqlite3
 import sys
 import traceback
+from collections import deque
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import date
-from importlib.metadata import PackageNotFoundError, version
 from importlib.resources import as_file, files
 from pathlib import Path
-from typing import Any, Self
+from typing import TYPE_CHECKING, Any, Literal, Self
 from uuid import uuid4
 
+import orjson
 from langchain_core.language_models import BaseLanguageModel
 from langchain_core.prompts.base import BasePromptTemplate
 from langchain_core.prompts.loading import load_prompt
@@ -27,37 +32,39 @@ from pydantic import (
     model_validator,
 )
 from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, PointStruct, VectorParams
+from qdrant_client.models import Batch, Distance, VectorParams
 
+from sec_nlp._version import __version__
 from sec_nlp.core.config import get_logger, settings
 from sec_nlp.core.downloader import FilingManager
 from sec_nlp.core.enums import FilingMode
+from sec_nlp.core.llm.cache import SummaryCache
 from sec_nlp.core.llm.chains import (
     SummarizationInput,
     SummarizationOutput,
+    build_summarization_batch_fn,
     build_summarization_runnable,
 )
 from sec_nlp.core.preprocessor import Preprocessor
 
-logger = get_logger(__name__)
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
 
+logger = get_logger(__name__)
 
-def _get_version() -> str:
-    """Get package version using importlib.metadata."""
-    try:
-        return version("sec_nlp")
-    except PackageNotFoundError:
-        return "0.0.0.dev"
+_SLUG_RE = re.compile(r"[^a-z0-9-]+")
+_SAFE_NAME_RE = re.compile(r"[^a-zA-Z0-9._-]+")
 
 
 def _slugify(s: str) -> str:
     """Convert string to URL-safe slug."""
-    return re.sub(r"[^a-z0-9-]+", "-", s.lower()).strip("-")
+    return _SLUG_RE.sub("-", s.lower()).strip("-")
 
 
-def _safe_name(s: str, allow: str = r"a-zA-Z0-9._-") -> str:
+def _safe_name(s: str) -> str:
     """Sanitize string for use in filenames."""
-    return re.sub(rf"[^{allow}]+", "_", s)[:120]
+    return _SAFE_NAME_RE.sub("_", s)[:120]
 
 
 def default_prompt_path() -> Path:
@@ -144,6 +151,12 @@ class Pipeline(BaseModel):
     require_json: bool = True
     max_retries: int = 2
     batch_size: int = 16
+    cache_summaries: bool = True
+    compile_llm: bool = False
+    quantization: Literal["none", "auto", "int8", "nf4", "bf16", "fp16"] = "none"
+    llm_backend: Literal["torch", "onnx"] = "torch"
+    workers: int = 1
+    fast_path: bool = True
 
     email: str | None = None
     collection_name: str | None = None
@@ -151,12 +164,19 @@ class Pipeline(BaseModel):
     dry_run: bool = False
 
     _prompt: BasePromptTemplate[Any]
-    _llm: BaseLanguageModel[Any]
+    _llm: BaseLanguageModel[Any] | None = PrivateAttr(default=None)
     _pre: Preprocessor | None = PrivateAttr(default=None)
+    _filings: FilingManager | None = PrivateAttr(default=None)
     _qdrant: QdrantClient | None = PrivateAttr(default=None)
     _embedder: Any | None = PrivateAttr(default=None)
     _embedding_dim: int | None = PrivateAttr(default=None)
     _graph: Runnable[SummarizationInput, SummarizationOutput] | None = PrivateAttr(default=None)
+    _safe_kw: str = PrivateAttr(default="")
+    _prompt_hash: str = PrivateAttr(default="")
+    _summary_cache: SummaryCache | None = PrivateAttr(default=None)
+    _batch_fn: Callable[[Sequence[SummarizationInput]], list[SummarizationOutput]] | None = (
+        PrivateAttr(default=None)
+    )
 
     @field_validator("start_date")
     @classmethod
@@ -229,7 +249,7 @@ class Pipeline(BaseModel):
             raise ValueError("limit must be a positive integer when provided")
         return v
 
-    @field_validator("max_new_tokens", "max_retries", "batch_size")
+    @field_validator("max_new_tokens", "max_retries", "batch_size", "workers")
     @classmethod
     def _positive_int(cls, v: int) -> int:
         """Validate integer fields are positive."""
@@ -269,6 +289,8 @@ class Pipeline(BaseModel):
         if self.email is None:
             self.email = os.getenv("EMAIL", settings.email)
 
+        self._safe_kw = _slugify(self.keyword)
+
         try:
             self._prompt = load_prompt(str(self.prompt_file))
             logger.info("Loaded prompt: %s", self.prompt_file)
@@ -277,28 +299,64 @@ class Pipeline(BaseModel):
                 "%s: Failed to load prompt from %s: %s", type(e).__name__, self.prompt_file, e
             ) from e
 
-        try:
-            if self.model_name.startswith("ollama:"):
-                from sec_nlp.core.llm import build_ollama_llm
-
-                model_id = self.model_name.split(":", 1)[1]
-                self._llm = build_ollama_llm(model_name=model_id)
-            else:
-                from sec_nlp.core.llm import build_hf_pipeline
-
-                self._llm = build_hf_pipeline(self.model_name)
-
-        except Exception as e:
-            raise RuntimeError(
-                "%s -- LLM failed to load %s: %s", type(e).__name__, self.model_name, e
-            ) from e
+        # Fingerprint everything besides the chunk inputs that shapes a summary
+        template = self._prompt.format(**{v: f"{{{v}}}" for v in self._prompt.input_variables})
+        self._prompt_hash = SummaryCache.make_key(
+            self.model_name,
+            template,
+            str(self.max_new_tokens),
+            self.quantization,
+            self.llm_backend,
+            str(self.compile_llm),
+            str(self.require_json),
+            str(self.fast_path),
+        )
 
-        pkg_version = _get_version()
         python_version = sys.version.split()[0]
-        logger.info("Pipeline initialized: sec_nlp %s | Python %s", pkg_version, python_version)
+        logger.info("Pipeline initialized: sec_nlp %s | Python %s", __version__, python_version)
         logger.info("Output directory: %s", self.out_path)
         logger.info("Download directory: %s", self.dl_path)
 
+    def _get_llm(self) -> BaseLanguageModel[Any]:
+        """
+        Get or load the LLM (lazy initialization).
+
+        Deferred until a symbol with filings is processed, so constructing a
+        Pipeline (e.g. the parent of a multi-process run, which only dispatches
+        work) never imports torch or loads model weights.
+        """
+        if self._llm is None:
+            try:
+                if self.model_name.startswith("ollama:"):
+                    from sec_nlp.core.llm import build_ollama_llm
+
+                    model_id = self.model_name.split(":", 1)[1]
+                    self._llm = build_ollama_llm(model_name=model_id)
+                else:
+                    from sec_nlp.core.llm import build_hf_pipeline
+
+                    self._llm = build_hf_pipeline(
+                        self.model_name,
+                        batch_size=self.batch_size,
+                        max_new_tokens=self.max_new_tokens,
+                        compile_model=self.compile_llm,
+                        quantization=self.quantization,
+                        backend=self.llm_backend,
+                    )
+
+            except Exception as e:
+                raise RuntimeError(
+                    "%s -- LLM failed to load %s: %s", type(e).__name__, self.model_name, e
+                ) from e
+
+        return self._llm
+
+    def _get_filing_manager(self) -> FilingManager:
+        """Get or create the filing manager shared by all downloads (lazy initialization)."""
+        if self._filings is None:
+            self._filings = FilingManager(email=str(self.email), downloads_folder=self.dl_path)
+        return self._filings
+
     def _get_preprocessor(self) -> Preprocessor:
         """Get or create preprocessor instance (lazy initialization)."""
         if self._pre is None:
@@ -348,14 +406,23 @@ class Pipeline(BaseModel):
                     "sentence-transformers not installed. Run: uv pip install sentence-transformers"
                 ) from e
 
-            self._embedder = SentenceTransformer(
-                settings.embedding_model, device=settings.embedding_device
-            )
+            if settings.embedding_backend == "onnx-int8":
+                self._embedder = _load_int8_embedder(
+                    settings.embedding_model, settings.embedding_device
+                )
+            else:
+                self._embedder = SentenceTransformer(
+                    settings.embedding_model,
+                    device=settings.embedding_device,
+                    backend=settings.embedding_backend,
+                )
 
-            # Infer embedding dimension
+            # Read the dimension from the model config; fall back to a probe encode
             if self._embedding_dim is None:
-                test_embedding = self._embedder.encode(["test"], show_progress_bar=False)
-                self._embedding_dim = len(test_embedding[0])
+                dim = self._embedder.get_sentence_embedding_dimension()
+                if dim is None:
+                    dim = len(self._embedder.encode(["test"], show_progress_bar=False)[0])
+                self._embedding_dim = int(dim)
                 logger.info(
                     "Inferred embedding dimension: %d for model %s",
                     self._embedding_dim,
@@ -400,29 +467,31 @@ class Pipeline(BaseModel):
             settings.qdrant_distance,
         )
 
-    def _embed_texts(self, texts: list[str]) -> list[list[float]]:
-        """Generate embeddings for texts."""
-        if not texts:
-            return []
-
+    def _embed_texts(self, texts: list[str]) -> NDArray[np.float32]:
+        """Generate embeddings for texts as a (len(texts), dim) float32 array."""
         embedder = self._ensure_embedder()
-        embeddings = embedder.encode(
+        return embedder.encode(  # type: ignore[no-any-return]
             texts,
             batch_size=settings.embedding_batch_size,
             show_progress_bar=False,
             convert_to_numpy=True,
         )
 
-        return [emb.tolist() for emb in embeddings]
-
     def _upsert_texts(
         self,
         collection_name: str,
         texts: list[str],
         metadata: list[dict[str, Any]] | None = None,
         ids: list[str] | None = None,
+        common_meta: dict[str, Any] | None = None,
     ) -> list[str]:
-        """Upsert texts with embeddings into Qdrant collection."""
+        """
+        Upsert texts with embeddings into Qdrant collection.
+
+        `common_meta` is merged into every payload, so fields shared by all
+        texts (source file, symbol, keyword) need not be repeated per item in
+        `metadata`.
+        """
         if not texts:
             return []
 
@@ -433,27 +502,44 @@ class Pipeline(BaseModel):
             return [str(uuid4()) for _ in texts]
 
         client = self._ensure_qdrant()
-        vectors = self._embed_texts(texts)
 
         if ids is None:
             ids = [str(uuid4()) for _ in texts]
-        if metadata is None:
-            metadata = [{} for _ in texts]
-
-        # Create points
-        points = [
-            PointStruct(
-                id=point_id,
-                vector=vector,
-                payload={**meta, "text": text},
-            )
-            for point_id, vector, text, meta in zip(ids, vectors, texts, metadata, strict=True)
-        ]
-
-        # Upsert to Qdrant
-        client.upsert(collection_name=collection_name, points=points)
+        shared = common_meta or {}
 
-        logger.info("Upserted %d vectors to collection %s", len(points), collection_name)
+        # The columnar Batch form skips building and validating a point model per text
+        def send(start: int, end: int, vectors: NDArray[np.float32]) -> None:
+            chunk = texts[start:end]
+            if metadata is None:
+                payloads = [{**shared, "text": text} for text in chunk]
+            else:
+                payloads = [
+                    {**shared, **meta, "text": text}
+                    for text, meta in zip(chunk, metadata[start:end], strict=True)
+                ]
+            batch = Batch(ids=ids[start:end], vectors=vectors.tolist(), payloads=payloads)
+            client.upsert(collection_name=collection_name, points=batch)
+
+        # Embed and upsert one slice at a time so peak memory is bounded by the
+        # slice size rather than the filing. The next slice is embedded while up
+        # to `qdrant_upsert_parallelism` earlier slices are in flight to Qdrant.
+        step = settings.qdrant_upsert_batch_size
+        if len(texts) <= step:
+            send(0, len(texts), self._embed_texts(texts))
+        else:
+            limit = settings.qdrant_upsert_parallelism
+            inflight: deque[Future[None]] = deque()
+            with ThreadPoolExecutor(max_workers=limit, thread_name_prefix="qdrant-send") as pool:
+                for start in range(0, len(texts), step):
+                    end = start + step
+                    vectors = self._embed_texts(texts[start:end])
+                    if len(inflight) >= limit:
+                        inflight.popleft().result()
+                    inflight.append(pool.submit(send, start, end, vectors))
+                for future in inflight:
+                    future.result()
+
+        logger.info("Upserted %d vectors to collection %s", len(texts), collection_name)
         return ids
 
     def _get_graph(self) -> Runnable[SummarizationInput, SummarizationOutput]:
@@ -461,13 +547,75 @@ class Pipeline(BaseModel):
         if self._graph is None:
             self._graph = build_summarization_runnable(
                 prompt=self._prompt,
-                llm=self._llm,
+                llm=self._get_llm(),
                 require_json=bool(self.require_json),
             )
             logger.info("Built summarization runnable graph.")
 
         return self._graph
 
+    def _batch_summarize(
+        self,
+        graph: Runnable[SummarizationInput, SummarizationOutput],
+        items: list[SummarizationInput],
+    ) -> list[SummarizationOutput]:
+        """Summarize prompt inputs via the direct batch path, or the runnable graph."""
+        if not self.fast_path:
+            return graph.batch(items)  # type: ignore[arg-type]
+        if self._batch_fn is None:
+            self._batch_fn = build_summarization_batch_fn(prompt=self._prompt, llm=self._get_llm())
+        return self._batch_fn(items)
+
+    def _get_summary_cache(self) -> SummaryCache:
+        """Get or open the on-disk summary cache (lazy initialization)."""
+        if self._summary_cache is None:
+            self._summary_cache = SummaryCache(self.out_path / "summary_cache.sqlite")
+        return self._summary_cache
+
+    def _summarize_cached(
+        self,
+        graph: Runnable[SummarizationInput, SummarizationOutput],
+        window: list[SummarizationInput],
+    ) -> list[dict[str, Any]]:
+        """
+        Summarize a window of inputs, serving repeated chunks from the cache.
+
+        Only cache misses are sent to the LLM; error results are not cached.
+        """
+        if not self.cache_summaries:
+            results = self._batch_summarize(graph, window)
+            # Flat model of JSON-native fields: a shallow dict() equals model_dump()
+            # without a trip through the serializer
+            return [dict(r) for r in results]
+
+        cache = self._get_summary_cache()
+        keys = [
+            SummaryCache.make_key(
+                self._prompt_hash, inp["symbol"], inp["search_term"], inp["chunk"]
+            )
+            for inp in window
+        ]
+        found = cache.get_many(keys)
+        # One LLM call per distinct key: boilerplate often repeats within a window
+        misses: dict[str, int] = {}
+        for i, key in enumerate(keys):
+            if key not in found:
+                misses.setdefault(key, i)
+
+        if misses:
+            todo = [window[i] for i in misses.values()]
+            results = self._batch_summarize(graph, todo)
+            fresh = {key: dict(r) for key, r in zip(misses, results, strict=True)}
+            try:
+                cache.put_many((k, v) for k, v in fresh.items() if v.get("error") is None)
+            except sqlite3.Error as e:
+                # The summaries are still good; only the cache write is lost
+                logger.warning("Summary cache write failed: %s", e)
+            found.update(fresh)
+
+        logger.debug("Summary cache: %d of %d chunk(s) sent to the LLM", len(misses), len(window))
+        return [found[key] for key in keys]
+
     def run_all(self, symbols: list[str]) -> dict[str, list[Path]]:
         """
         Run pipeline for multiple symbols.
@@ -478,7 +626,100 @@ class Pipeline(BaseModel):
         Returns:
             Dictionary mapping symbols to output file paths
         """
-        return {sym: self.run(sym) for sym in symbols}
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.run_all_async(symbols))
+
+        # Already inside an event loop (Jupyter, async callers): asyncio.run
+        # would raise there, so drive a fresh loop on a helper thread instead
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="run-all") as pool:
+            return pool.submit(asyncio.run, self.run_all_async(symbols)).result()
+
+    async def run_all_async(self, symbols: list[str]) -> dict[str, list[Path]]:
+        """
+        Run pipeline for multiple symbols, downloading filings concurrently.
+
+        Downloads are I/O-bound and are fetched concurrently through one
+        shared filing manager, bounded by `settings.sec_rate_limit` to respect
+        SEC rate limits; processing then runs per
+        symbol, across `workers` processes when more than one is configured.
+
+        Args:
+            symbols: List of stock ticker symbols
+
+        Returns:
+            Dictionary mapping symbols to output file paths
+        """
+        symbols = [s.strip().upper() for s in symbols]
+        sem = asyncio.Semaphore(settings.sec_rate_limit)
+        self._get_filing_manager()  # build once, before the threads share it
+
+        async def _fetch(symbol: str) -> None:
+            async with sem:
+                await asyncio.to_thread(self._download, symbol)
+
+        async with asyncio.TaskGroup() as tg:
+            for symbol in dict.fromkeys(symbols):
+                tg.create_task(_fetch(symbol))
+
+        return self._process_many(symbols)
+
+    def _process_many(self, symbols: list[str]) -> dict[str, list[Path]]:
+        """Process already-downloaded symbols, fanning out to worker processes if enabled."""
+        unique = list(dict.fromkeys(symbols))
+        if self.workers <= 1 or len(unique) <= 1:
+            parser = self._parse_pool()
+            try:
+                return {symbol: self._process(symbol, parser) for symbol in symbols}
+            finally:
+                if parser is not None:
+                    parser.shutdown()
+
+        workers = min(self.workers, len(unique))
+        # Split cores between workers so torch intra-op pools don't oversubscribe
+        threads = max(1, (os.cpu_count() or 1) // workers)
+        config = self.model_dump(exclude={"keyword_lower"})
+
+        logger.info("Processing %d symbols across %d worker processes", len(unique), workers)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(threads, config),
+        ) as pool:
+            futures = {s: pool.submit(_process_in_worker, s) for s in unique}
+            results = {s: future.result() for s, future in futures.items()}
+
+        return {symbol: results[symbol] for symbol in symbols}
+
+    def _parse_pool(self) -> ProcessPoolExecutor | None:
+        """
+        Process pool for CPU-bound HTML parsing, shared by every symbol of a run.
+
+        Returns None on a single core. Symbol-level worker processes never get
+        one, so pools are not nested inside pool workers.
+        """
+        cores = os.cpu_count() or 1
+        if cores <= 1:
+            return None
+        return ProcessPoolExecutor(
+            max_workers=cores, mp_context=multiprocessing.get_context("spawn")
+        )
+
+    def _download(self, symbol: str) -> bool:
+        """Download filings for a single symbol into dl_path, returning whether it succeeded."""
+        ok = self._get_filing_manager().download_symbol(
+            symbol,
+            mode=self.mode,
+            start_date=self.start_date,
+            end_date=self.end_date,
+        )
+        if not ok:
+            logger.warning(
+                "Download failed for %s; processing any filings already on disk.", symbol
+            )
+        return ok
 
     def run(self, symbol: str) -> list[Path]:
         """
@@ -498,8 +739,22 @@ class Pipeline(BaseModel):
         Returns:
             List of output file paths
         """
-        logger.info("Processing symbol: %s", symbol)
         symbol = symbol.strip().upper()
+        self._download(symbol)
+        parser = self._parse_pool()
+        try:
+            return self._process(symbol, parser)
+        finally:
+            if parser is not None:
+                parser.shutdown()
+
+    def _process(self, symbol: str, parser: Executor | None = None) -> list[Path]:
+        """
+        Process already-downloaded filings for a symbol (steps 2-6 of `run`).
+
+        Uncached filings are parsed on `parser` when given, otherwise inline.
+        """
+        logger.info("Processing symbol: %s", symbol)
 
         logger.info(
             "Pipeline start: %s (%s → %s) mode=%s (form=%s) keyword=%r dry_run=%s",
@@ -512,14 +767,6 @@ class Pipeline(BaseModel):
             self.dry_run,
         )
 
-        downloader = FilingManager(email=str(self.email), downloads_folder=self.dl_path)
-        downloader.add_symbol(symbol)
-        downloader.download_filings(
-            start_date=self.start_date,
-            end_date=self.end_date,
-            mode=self.mode,
-        )
-
         pre = self._get_preprocessor()
         html_paths = pre.html_paths_for_symbol(symbol, mode=self.mode, limit=self.limit)
         if not html_paths:
@@ -536,24 +783,83 @@ class Pipeline(BaseModel):
         else:
             logger.info("Dry-run: skipping Qdrant collection provisioning and upserts.")
 
-        output_files: list[Path] = []
+        out_prefix = f"{symbol.lower()}_{self._safe_kw}_"
+
+        # HTML parsing is CPU-bound, so uncached filings are parsed on the run's
+        # parse pool while earlier ones are summarized. Summary files are
+        # serialized and written on a background thread so disk I/O overlaps the
+        # next filing; embedding + Qdrant upserts likewise run on their own
+        # thread alongside generation.
+        with (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="summary-writer") as writer,
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="qdrant-upsert") as upserter,
+        ):
+            parsed = (
+                pre.submit_transforms(parser, html_paths)
+                if parser is not None and len(html_paths) > 1
+                else {}
+            )
+            pending = [
+                writer.submit(self._write_summary, out_file, payload)
+                for out_file, payload in self._iter_summaries(
+                    symbol, pre, graph, html_paths, collection_name, out_prefix, upserter, parsed
+                )
+            ]
+            return [future.result() for future in pending]
+
+    def _write_summary(self, out_file: Path, payload: dict[str, Any]) -> Path:
+        """Serialize one summary payload to disk."""
+        # numpy scalars/arrays (e.g. similarity scores) serialize natively
+        out_file.write_bytes(
+            orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        )
+        logger.info("Summary written to %s", out_file.resolve())
+        return out_file
+
+    def _iter_summaries(
+        self,
+        symbol: str,
+        pre: Preprocessor,
+        graph: Runnable[SummarizationInput, SummarizationOutput],
+        html_paths: list[Path],
+        collection_name: str,
+        out_prefix: str,
+        upserter: Executor,
+        parsed: Mapping[Path, Future[None]],
+    ) -> Iterator[tuple[Path, dict[str, Any]]]:
+        """
+        Yield (output path, payload) for each filing with keyword matches.
+
+        A filing's vectors are upserted on `upserter` while its chunks are
+        summarized; the upsert is awaited before the payload is yielded.
+        Filings with a job in `parsed` are waited on, then read from the
+        transform cache.
+        """
+        # Loop invariants read once instead of per chunk/window
+        keyword = self.keyword
+        bsz = self.batch_size
+        summarize = self._summarize_cached
 
         for html_path in html_paths:
-            chunks = pre.transform_html(html_path)
-            relevant = [
-                c.page_content for c in chunks if self.keyword_lower in c.page_content.lower()
-            ]
+            if (job := parsed.get(html_path)) is not None:
+                job.result()
+            relevant: list[str] = []
+            inputs: list[SummarizationInput] = []
+            for text in pre.iter_relevant_chunks(html_path, keyword):
+                relevant.append(text)
+                inputs.append(SummarizationInput(symbol=symbol, chunk=text, search_term=keyword))
 
             if not relevant:
-                logger.warning("No chunks matched keyword %r in %s.", self.keyword, html_path.name)
+                logger.warning("No chunks matched keyword %r in %s.", keyword, html_path.name)
                 continue
 
-            metas = [
-                {"source": html_path.name, "symbol": symbol, "keyword": self.keyword}
-                for _ in relevant
-            ]
+            # One shared str for the source name across every vector payload
+            source = sys.intern(html_path.name)
+            common = {"source": source, "symbol": symbol, "keyword": keyword}
 
-            self._upsert_texts(collection_name, relevant, metadata=metas)
+            upsert = upserter.submit(
+                self._upsert_texts, collection_name, relevant, common_meta=common
+            )
 
             logger.info(
                 "%d relevant chunks found in %s. Summarizing...",
@@ -561,23 +867,20 @@ class Pipeline(BaseModel):
                 html_path.name,
             )
 
-            inputs: list[SummarizationInput] = [
-                SummarizationInput(symbol=symbol, chunk=chunk, search_term=self.keyword)
-                for chunk in relevant
-            ]
+            # Batch chunks of similar length together so padded batches waste
+            # little encoder work on padding; results are restored to chunk order
+            order = sorted(range(len(inputs)), key=lambda j: len(inputs[j]["chunk"]))
+            by_length = [inputs[j] for j in order]
+            sorted_summaries: list[dict[str, Any]] = []
 
-            summaries: list[dict[str, Any]] = []
-
-            for i in range(0, len(inputs), int(self.batch_size)):
-                window = inputs[i : i + int(self.batch_size)]
+            for i in range(0, len(by_length), bsz):
+                window = by_length[i : i + bsz]
                 try:
-                    results: list[SummarizationOutput] = graph.batch(window)
-                    for r in results:
-                        summaries.append(r.model_dump())
+                    sorted_summaries.extend(summarize(graph, window))
                 except Exception as e:
                     logger.error("Batch invocation failed: %s: %s", type(e).__name__, e.__cause__)
                     traceback.print_exc()
-                    summaries.extend(
+                    sorted_summaries.extend(
                         [
                             {
                                 "error": f"Exception: {type(e).__name__}: {e.__traceback__} -- {e.__cause__}"
@@ -586,23 +889,59 @@ class Pipeline(BaseModel):
                         ]
                     )
 
-            safe_kw = _slugify(self.keyword)
-            safe_doc = _safe_name(html_path.stem)
-            out_file = self.out_path / f"{symbol.lower()}_{safe_kw}_{safe_doc}.summary.json"
-
-            with open(out_file, "w", encoding="utf-8") as f:
-                json.dump(
-                    {
-                        "symbol": symbol,
-                        "document": html_path.name,
-                        "collection": collection_name,
-                        "summaries": summaries,
-                    },
-                    f,
-                    indent=2,
-                )
+            summaries: list[dict[str, Any]] = [{}] * len(inputs)
+            for pos, j in enumerate(order):
+                summaries[j] = sorted_summaries[pos]
+
+            upsert.result()
+
+            out_file = self.out_path / f"{out_prefix}{_safe_name(html_path.stem)}.summary.json"
+            yield (
+                out_file,
+                {
+                    "symbol": symbol,
+                    "document": html_path.name,
+                    "collection": collection_name,
+                    "summaries": summaries,
+                },
+            )
+
+
+# Per-process Pipeline built by _init_worker; its LLM and summarization graph
+# are loaded once and reused for every symbol the worker processes
+_WORKER_PIPELINE: Pipeline | None = None
+
+
+_INT8_ONNX_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+
+
+def _load_int8_embedder(model_name: str, device: str) -> Any:
+    """Load a dynamically quantized ONNX embedder, exporting it on first use."""
+    from sentence_transformers import SentenceTransformer, export_dynamic_quantized_onnx_model
+
+    local = Path(user_cache_dir("sec_nlp", "sec_nlp")) / "embedder-int8" / _safe_name(model_name)
+    if not (local / _INT8_ONNX_FILE).exists():
+        model = SentenceTransformer(model_name, device=device, backend="onnx")
+        model.save(str(local))
+        export_dynamic_quantized_onnx_model(model, "avx512_vnni", str(local))
+        logger.info("Exported int8 ONNX embedder for %s to %s", model_name, local)
+
+    return SentenceTransformer(
+        str(local), device=device, backend="onnx", model_kwargs={"file_name": _INT8_ONNX_FILE}
+    )
+
+
+def _init_worker(num_threads: int, config: dict[str, Any]) -> None:
+    """Limit torch intra-op threads and rebuild the Pipeline in a worker process."""
+    import torch
+
+    global _WORKER_PIPELINE
+    torch.set_num_threads(num_threads)
+    _WORKER_PIPELINE = Pipeline.model_validate(config)
 
-            logger.info("Summary written to %s", out_file.resolve())
-            output_files.append(out_file)
 
-        return output_files
+def _process_in_worker(symbol: str) -> list[Path]:
+    """Process one symbol with this worker's Pipeline."""
+    if _WORKER_PIPELINE is None:
+        raise RuntimeError("Worker process was not initialized with a Pipeline")
+    return _WORKER_PIPELINE._process(symbol)
@@ -1,8 +1,14 @@
 # sec_nlp/core/preprocessor.py
 from __future__ import annotations
 
+import hashlib
 import os
-from collections.abc import Sequence
+import pickle
+import re
+from bisect import bisect_right
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Executor, Future
+from itertools import accumulate
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +22,51 @@ from sec_nlp.core.enums import FilingMode
 
 logger = get_logger(__name__)
 
+_CHUNK_SIZE = 2000
+_CHUNK_OVERLAP = 200
+# Bump when the loader/splitter output changes so stale cache entries are ignored
+_CACHE_VERSION = 3
+
+_HSPACE_RE = re.compile(r"[^\S\n]+")
+_LINE_EDGE_RE = re.compile(r" ?\n ?")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
+def _clean_text(text: str) -> str:
+    """
+    Collapse layout whitespace left by BeautifulSoup (indentation, runs of blank lines).
+
+    Line breaks are kept and paragraph breaks are kept as one blank line, since
+    the text splitter uses them as its preferred chunk boundaries.
+    """
+    text = _LINE_EDGE_RE.sub("\n", _HSPACE_RE.sub(" ", text))
+    return _BLANK_LINES_RE.sub("\n\n", text).strip()
+
+
+def _chunks_with_keyword(texts: Sequence[str], keyword: str) -> list[str]:
+    """
+    Chunks containing `keyword` (case-insensitive), in order.
+
+    Lowercases the joined chunks in one call and jumps between hits with
+    `str.find`, so the Python-level work scales with the number of matching
+    chunks rather than the number of chunks.
+    """
+    needle = keyword.lower()
+    haystack = "\x00".join(texts).lower()
+    # Offsets only line up if lowercasing kept every length (e.g. no U+0130)
+    if not needle or len(haystack) != sum(map(len, texts)) + max(len(texts) - 1, 0):
+        return [t for t in texts if needle in t.lower()]
+
+    # Start offset of each chunk within the joined string
+    starts = [0, *accumulate(len(t) + 1 for t in texts)]
+    hits: list[str] = []
+    pos = haystack.find(needle)
+    while pos != -1:
+        i = bisect_right(starts, pos) - 1
+        hits.append(texts[i])
+        pos = haystack.find(needle, starts[i + 1])
+    return hits
+
 
 class Preprocessor(BaseModel):
     """
@@ -27,6 +78,7 @@ class Preprocessor(BaseModel):
     chunk_overlap: int = 100
     splitter: str = "default"
     transformer: str = "default"
+    cache_transforms: bool = True
 
     _splitter_impl: RecursiveCharacterTextSplitter = PrivateAttr()
 
@@ -45,7 +97,7 @@ class Preprocessor(BaseModel):
 
     def model_post_init(self, __ctx: Any) -> None:
         self._splitter_impl = RecursiveCharacterTextSplitter(
-            chunk_size=2000, chunk_overlap=200, add_start_index=True
+            chunk_size=_CHUNK_SIZE, chunk_overlap=_CHUNK_OVERLAP, add_start_index=True
         )
 
     def _filing_dir(self, symbol: str, mode: FilingMode) -> Path:
@@ -67,24 +119,78 @@ class Preprocessor(BaseModel):
         html_files = sorted(base.rglob("*.html"), key=os.path.getmtime, reverse=True)
         return html_files[:limit] if limit else html_files
 
+    def _cache_file(self, html_path: Path) -> Path:
+        h = hashlib.sha256(html_path.read_bytes())
+        h.update(f"{_CACHE_VERSION}:{_CHUNK_SIZE}:{_CHUNK_OVERLAP}".encode())
+        return self.downloads_folder / ".xform_cache" / f"{h.hexdigest()}.pkl"
+
     def transform_html(self, html_path: Path) -> Sequence[Document]:
         if not html_path.exists():
             raise FileNotFoundError("File not found: %s", html_path.resolve())
+
+        cache_file = self._cache_file(html_path) if self.cache_transforms else None
+        if cache_file is not None and cache_file.exists():
+            try:
+                with cache_file.open("rb") as f:
+                    cached: list[Document] = pickle.load(f)
+                logger.info("Loaded %d cached documents for %s", len(cached), html_path.name)
+                return cached
+            except (OSError, EOFError, pickle.UnpicklingError) as e:
+                logger.warning("Ignoring unreadable transform cache %s: %s", cache_file.name, e)
+
         loader = BSHTMLLoader(file_path=html_path)
-        html_docs = loader.load_and_split(self._splitter_impl)
-        finished_docs = self._splitter_impl.transform_documents(html_docs)
+        html_docs = loader.load()
+        for doc in html_docs:
+            doc.page_content = _clean_text(doc.page_content)
+        finished_docs = self._splitter_impl.split_documents(html_docs)
         logger.info(
             "Loaded %d transformed documents from %s",
             len(finished_docs),
             html_path.name,
         )
+
+        if cache_file is not None:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so concurrent runs never read a partial file
+            tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with tmp.open("wb") as f:
+                pickle.dump(list(finished_docs), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cache_file)
+
         return finished_docs
 
+    def submit_transforms(
+        self, pool: Executor, html_paths: Sequence[Path]
+    ) -> dict[Path, Future[None]]:
+        """
+        Parse uncached filings on `pool` (a process pool) into the transform cache.
+
+        Wait on a path's future before iterating it; `transform_html` then loads
+        the cached documents. No jobs are submitted when caching is off.
+        """
+        if not self.cache_transforms:
+            return {}
+
+        config = self.model_dump()
+        return {
+            path: pool.submit(_transform_in_worker, config, path)
+            for path in html_paths
+            if not self._cache_file(path).exists()
+        }
+
+    def iter_relevant_chunks(self, html_path: Path, keyword: str) -> Iterator[str]:
+        """Yield the chunks of a filing that contain `keyword` (case-insensitive)."""
+        docs = self.transform_html(html_path)
+        yield from _chunks_with_keyword([doc.page_content for doc in docs], keyword)
+
     def html_to_text(self, html_path: Path) -> list[str]:
         loader = BSHTMLLoader(file_path=html_path, bs_kwargs={"features": "lxml"})
-        docs = loader.load_and_split(self._splitter_impl)
-        logger.info("Loaded %d raw text chunks from %s", len(docs), html_path.name)
-        return [doc.page_content for doc in docs]
+        docs = loader.load()
+        for doc in docs:
+            doc.page_content = _clean_text(doc.page_content)
+        chunks = self._splitter_impl.split_documents(docs)
+        logger.info("Loaded %d raw text chunks from %s", len(chunks), html_path.name)
+        return [doc.page_content for doc in chunks]
 
     def batch_transform_html(self, html_paths: list[Path]) -> list[Document]:
         all_docs: list[Document] = []
@@ -96,3 +202,8 @@ class Preprocessor(BaseModel):
             len(html_paths),
         )
         return all_docs
+
+
+def _transform_in_worker(config: dict[str, Any], html_path: Path) -> None:
+    """Process-pool entry point: parse one filing into the transform cache."""
+    Preprocessor(**config).transform_html(html_path)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import sys
 from collections.abc import Iterable, Mapping
 from pathlib import Path
 from typing import Any
@@ -9,9 +8,7 @@ from unittest.mock import MagicMock, call, patch
 import pytest
 
 
-def test_cli_main_wires_pipeline_and_cleans(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
+def test_cli_main_wires_pipeline_and_cleans(tmp_path: Path) -> None:
     out = tmp_path / "out"
     out.mkdir()
     dl = tmp_path / "dl"
@@ -25,7 +22,6 @@ def test_cli_main_wires_pipeline_and_cleans(
             return {s: [out / f"{s.lower()}_x.json"] for s in symbols}
 
     argv: list[str] = [
-        "sec_nlp.cli",
         "AAPL",
         "MSFT",
         "--mode",
@@ -42,9 +38,6 @@ def test_cli_main_wires_pipeline_and_cleans(
         "--no-cleanup",
     ]
 
-    monkeypatch.setattr(sys, "argv", argv)
-
-    # Import first to see the module structure
     import sec_nlp.cli.__main__ as cli_main
 
     # Patch on the actual module object
@@ -53,8 +46,18 @@ def test_cli_main_wires_pipeline_and_cleans(
         patch.object(cli_main, "Pipeline", FakePipeline),
         patch.object(cli_main, "load_dotenv", MagicMock()),
     ):
-        cli_main.main()
+        cli_main.main(argv)
 
     # Verify directories exist
     assert out.exists()
     assert dl.exists()
+
+
+def test_parse_args_model_precision_flags() -> None:
+    import sec_nlp.cli.__main__ as cli_main
+
+    defaults = cli_main.parse_args([])
+    assert defaults.quantization == "none" and defaults.compile is False
+
+    args = cli_main.parse_args(["--quantization", "bf16", "--compile"])
+    assert args.quantization == "bf16" and args.compile is True
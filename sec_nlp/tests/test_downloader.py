@@ -22,3 +22,16 @@ def test_sec_downloader_calls_client(monkeypatch, tmp_path):
     assert res == {"AAPL": True, "MSFT": True}
     assert {c["filing_type"] for c in calls} == {"10-Q"}
     assert {c["symbol"] for c in calls} == {"AAPL", "MSFT"}
+
+
+def test_add_symbol_and_add_symbols_normalize_alike(tmp_path):
+    from sec_nlp.core.downloader import FilingManager
+
+    single = FilingManager(email="x@y.com", downloads_folder=tmp_path)
+    for s in [" aapl", "", "  ", "msft "]:
+        single.add_symbol(s)
+
+    bulk = FilingManager(email="x@y.com", downloads_folder=tmp_path)
+    bulk.add_symbols([" aapl", "", "  ", "msft "])
+
+    assert single._sorted_symbols() == bulk._sorted_symbols() == ("AAPL", "MSFT")
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from sec_nlp.core.llm.cache import SummaryCache
+from sec_nlp.core.pipeline import Pipeline
+
+
+def test_make_key_is_stable_and_order_sensitive() -> None:
+    k = SummaryCache.make_key("ns", "a", "b")
+    assert k == SummaryCache.make_key("ns", "a", "b")
+    assert len(k) == 32
+    assert k != SummaryCache.make_key("ns", "b", "a")
+    assert k != SummaryCache.make_key("ns", "ab")
+    assert k != SummaryCache.make_key("other", "a", "b")
+
+
+def test_get_many_hit_miss_and_persistence(tmp_path: Path) -> None:
+    path = tmp_path / "cache.sqlite"
+    cache = SummaryCache(path)
+    cache.put_many([("k1", {"summary": "one"})])
+    assert cache.get_many(["k1", "k2"]) == {"k1": {"summary": "one"}}
+    cache.close()
+
+    reopened = SummaryCache(path)
+    assert reopened.get_many(["k1"]) == {"k1": {"summary": "one"}}
+    reopened.close()
+
+
+def test_memory_eviction_falls_back_to_sqlite(tmp_path: Path) -> None:
+    cache = SummaryCache(tmp_path / "cache.sqlite", memory_size=1)
+    cache.put_many([("a", {"v": 1}), ("b", {"v": 2})])
+    assert cache.get_many(["a", "b"]) == {"a": {"v": 1}, "b": {"v": 2}}
+    cache.close()
+
+
+def _pipeline(cache: SummaryCache) -> Pipeline:
+    p = Pipeline.model_construct(cache_summaries=True)
+    p._prompt_hash = "prompt"
+    p._summary_cache = cache
+    return p
+
+
+def _inp(chunk: str) -> dict[str, str]:
+    return {"symbol": "AAPL", "search_term": "revenue", "chunk": chunk}
+
+
+def test_summarize_cached_skips_hits_and_errors(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sent: list[list[str]] = []
+
+    def fake_batch(self: Pipeline, graph: Any, items: list[Any]) -> list[dict[str, Any]]:
+        sent.append([i["chunk"] for i in items])
+        return [
+            {"summary": None, "error": "bad"} if i["chunk"] == "bad" else {"summary": i["chunk"]}
+            for i in items
+        ]
+
+    monkeypatch.setattr(Pipeline, "_batch_summarize", fake_batch)
+    p = _pipeline(SummaryCache(tmp_path / "cache.sqlite"))
+
+    window = [_inp("x"), _inp("x"), _inp("bad")]
+    first = p._summarize_cached(None, window)  # type: ignore[arg-type]
+    assert [r["summary"] for r in first] == ["x", "x", None]
+    assert sent == [["x", "bad"]]
+
+    second = p._summarize_cached(None, window)  # type: ignore[arg-type]
+    assert second == first
+    # Only the error entry was not cached
+    assert sent[1] == ["bad"]
+
+
+def test_summarize_cached_survives_cache_write_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fake_batch(self: Pipeline, graph: Any, items: list[Any]) -> list[dict[str, Any]]:
+        return [{"summary": i["chunk"]} for i in items]
+
+    def failing_put(self: SummaryCache, items: Any) -> None:
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(Pipeline, "_batch_summarize", fake_batch)
+    monkeypatch.setattr(SummaryCache, "put_many", failing_put)
+    p = _pipeline(SummaryCache(tmp_path / "cache.sqlite"))
+
+    out = p._summarize_cached(None, [_inp("y")])  # type: ignore[arg-type]
+    assert out == [{"summary": "y"}]
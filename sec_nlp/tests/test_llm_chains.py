@@ -4,11 +4,21 @@ import json
 from collections.abc import Callable
 from typing import Any
 
-from langchain_core.language_models import LLM
+import pytest
+from langchain_core.language_models import LLM, FakeListLLM
+from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.prompts import BasePromptTemplate, PromptTemplate
 from langchain_core.runnables import Runnable, RunnableConfig
+from pydantic import ValidationError
 
-from sec_nlp.core.llm.chains import SummarizationOutput, build_summarization_runnable
+from sec_nlp.core.llm.chains import (
+    SummarizationOutput,
+    SummarizationOutputParser,
+    _compile_formatter,
+    _output_parser,
+    build_summarization_batch_fn,
+    build_summarization_runnable,
+)
 
 from .conftest import FakeLLM
 
@@ -31,3 +41,66 @@ def test_chain_invoke_json_mode(fake_llm: Callable[bool, FakeLLM]) -> None:
     assert isinstance(out.summary, str)
     assert out.error is None
     assert out.raw_output is None
+
+
+def test_batch_fn_matches_runnable_batch() -> None:
+    prompt: BasePromptTemplate[Any] = PromptTemplate.from_template("{chunk}")
+    payload = json.dumps({"summary": "ok", "points": ["x"], "confidence": 0.7})
+    items = [
+        {"symbol": "AAPL", "chunk": "Revenue...", "search_term": "revenue"},
+        {"symbol": "MSFT", "chunk": "Cloud...", "search_term": "cloud"},
+    ]
+
+    chain = build_summarization_runnable(
+        prompt=prompt, llm=FakeListLLM(responses=[payload, "not json"]), require_json=True
+    )
+    batch_fn = build_summarization_batch_fn(
+        prompt=prompt, llm=FakeListLLM(responses=[payload, "not json"])
+    )
+
+    out = batch_fn(items)
+    assert out == chain.batch(items)
+    assert out[0].summary == "ok" and out[1].raw_output == "not json"
+    assert batch_fn([]) == []
+
+
+def test_compiled_formatter_matches_prompt_format() -> None:
+    prompt = PromptTemplate.from_template('{{"k": 1}} {symbol}/{search_term}: {chunk}')
+    fmt = _compile_formatter(prompt)
+    kwargs = {"symbol": "AAPL", "search_term": "risk", "chunk": "a {b} c"}
+
+    assert fmt is not prompt.format
+    assert fmt(**kwargs) == prompt.format(**kwargs)
+
+
+def test_parser_fast_path_matches_markdown_path() -> None:
+    parser = _output_parser()
+    payload = json.dumps({"summary": "ok", "points": ["x"], "confidence": 0.5})
+
+    assert parser.parse(payload) == parser.parse(f"```json\n{payload}\n```")
+    assert parser.parse(payload).summary == "ok"
+    assert parser.parse('{"confidence": 2}').error is not None
+
+
+def test_format_instructions_cached() -> None:
+    expected = PydanticOutputParser(pydantic_object=SummarizationOutput).get_format_instructions()
+    first = SummarizationOutputParser().get_format_instructions()
+
+    assert first == expected
+    assert SummarizationOutputParser().get_format_instructions() is first
+
+
+def test_summarization_output_is_frozen() -> None:
+    out = SummarizationOutput(summary="ok")
+    with pytest.raises(ValidationError):
+        out.summary = "changed"  # type: ignore[misc]
+    assert hash(out) == hash(SummarizationOutput(summary="ok"))
+
+
+def test_summarization_output_dict_matches_model_dump() -> None:
+    parser = _output_parser()
+    ok = parser.parse(json.dumps({"summary": "ok", "points": ["x"], "confidence": 0.5}))
+    bad = parser.parse("not json")
+
+    assert dict(ok) == ok.model_dump()
+    assert dict(bad) == bad.model_dump()
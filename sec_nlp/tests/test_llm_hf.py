@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from sec_nlp.core.llm import hf
+
+
+@pytest.fixture
+def captured_pipeline(monkeypatch: pytest.MonkeyPatch) -> dict[str, Any]:
+    """Record the kwargs build_hf_pipeline hands to transformers.pipeline."""
+    torch = pytest.importorskip("torch")
+    transformers = pytest.importorskip("transformers")
+
+    captured: dict[str, Any] = {}
+
+    def fake_pipeline(task: str, **kwargs: Any) -> MagicMock:
+        captured.update(kwargs, task=task)
+        pipe = MagicMock(task=task)
+        pipe.side_effect = lambda prompts, **_: [{"generated_text": "ok"} for _ in prompts]
+        captured["pipe"] = pipe
+        return pipe
+
+    monkeypatch.setattr(transformers, "pipeline", fake_pipeline)
+    monkeypatch.setattr(torch, "compile", lambda fn, **_: fn)
+    monkeypatch.setattr(
+        transformers.AutoModelForSeq2SeqLM, "from_pretrained", MagicMock(return_value=MagicMock())
+    )
+    monkeypatch.setattr(
+        hf, "_load_tokenizer", lambda name: SimpleNamespace(pad_token_id=0, eos_token_id=1)
+    )
+    return captured
+
+
+def test_generation_kwargs_reach_transformers_pipeline(captured_pipeline: dict[str, Any]) -> None:
+    hf.build_hf_pipeline("google/flan-t5-base", max_new_tokens=7, batch_size=4)
+
+    assert captured_pipeline["task"] == "text2text-generation"
+    assert captured_pipeline["batch_size"] == 4
+    assert captured_pipeline["max_new_tokens"] == 7
+    assert captured_pipeline["do_sample"] is False
+    assert captured_pipeline["num_beams"] == 1
+    assert captured_pipeline["use_cache"] is True
+    assert captured_pipeline["pad_token_id"] == 0
+    assert captured_pipeline["truncation"] is True
+
+
+def test_compiled_model_uses_static_cache(captured_pipeline: dict[str, Any]) -> None:
+    hf.build_hf_pipeline("google/flan-t5-base", compile_model=True)
+
+    assert captured_pipeline["cache_implementation"] == "static"
+    # Warmed up on one full batch, with no kwargs beyond the pipeline defaults
+    captured_pipeline["pipe"].assert_called_once_with(["warmup"] * 16)
@@ -0,0 +1,44 @@
+# sec_nlp/tests/test_llm_ollama.py
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from langchain_core.outputs import Generation, LLMResult
+from langchain_ollama.llms import OllamaLLM
+
+from sec_nlp.core.llm.ollama import build_ollama_llm
+
+
+def test_concurrent_batch_preserves_prompt_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[list[str]] = []
+    managers: list[Any] = []
+
+    def fake_generate(
+        self: OllamaLLM, prompts: list[str], stop: Any = None, run_manager: Any = None, **_k: Any
+    ) -> LLMResult:
+        calls.append(prompts)
+        managers.append(run_manager)
+        return LLMResult(generations=[[Generation(text=p.upper())] for p in prompts])
+
+    monkeypatch.setattr(OllamaLLM, "_generate", fake_generate)
+    llm = build_ollama_llm("llama3.2", num_parallel=3)
+
+    assert llm.batch(["a", "b", "c", "d"]) == ["A", "B", "C", "D"]
+    assert sorted(calls) == [["a"], ["b"], ["c"], ["d"]]
+    # Concurrent prompts never share the first prompt's run manager
+    assert managers == [None] * 4
+
+
+def test_concurrent_batch_failure_names_the_prompt(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fake_generate(self: OllamaLLM, prompts: list[str], *_a: Any, **_k: Any) -> LLMResult:
+        if prompts == ["b"]:
+            raise ConnectionError("server went away")
+        return LLMResult(generations=[[Generation(text=p)] for p in prompts])
+
+    monkeypatch.setattr(OllamaLLM, "_generate", fake_generate)
+    llm = build_ollama_llm("llama3.2", num_parallel=2)
+
+    with pytest.raises(ConnectionError) as exc:
+        llm.batch(["a", "b", "c"])
+    assert "prompt 2 of 3" in "".join(exc.value.__notes__)
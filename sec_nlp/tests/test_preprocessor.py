@@ -1,10 +1,11 @@
 # sec_nlp/tests/utils/test_preprocessor.py
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
 from sec_nlp.core.enums import FilingMode
-from sec_nlp.core.preprocessor import Preprocessor
+from sec_nlp.core.preprocessor import Preprocessor, _chunks_with_keyword, _clean_text
 
 
 def test_html_paths_for_symbol_and_limit(tmp_path: Path, write_html_tree) -> None:
@@ -21,3 +22,47 @@ def test_html_paths_for_symbol_missing_raises(tmp_path) -> None:
     pre = Preprocessor(downloads_folder=tmp_path / "dl2")
     with pytest.raises(FileNotFoundError):
         pre.html_paths_for_symbol("MSFT", mode=FilingMode.annual)
+
+
+def test_transform_html_served_from_cache(tmp_path: Path, monkeypatch) -> None:
+    html = tmp_path / "doc.html"
+    html.write_text("<html><body><p>Climate risk disclosure.</p></body></html>")
+    pre = Preprocessor(downloads_folder=tmp_path / "dl")
+
+    first = pre.transform_html(html)
+
+    def _fail(*_a, **_k):
+        raise AssertionError("loader should not run on a cache hit")
+
+    monkeypatch.setattr("sec_nlp.core.preprocessor.BSHTMLLoader", _fail)
+    second = pre.transform_html(html)
+
+    assert [d.page_content for d in second] == [d.page_content for d in first]
+
+
+def test_submit_transforms_fills_cache(tmp_path: Path) -> None:
+    html = tmp_path / "doc.html"
+    html.write_text("<html><body><p>Climate risk disclosure.</p></body></html>")
+    pre = Preprocessor(downloads_folder=tmp_path / "dl")
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        jobs = pre.submit_transforms(pool, [html])
+        for job in jobs.values():
+            job.result()
+
+    assert list(jobs) == [html] and pre._cache_file(html).exists()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        assert pre.submit_transforms(pool, [html]) == {}
+
+
+def test_clean_text_collapses_whitespace() -> None:
+    assert _clean_text("\n\n  Item 1A.\n\tRisk\u00a0 Factors  \n") == "Item 1A.\nRisk Factors"
+    assert _clean_text("Para one.\n \n\n\t\nPara two.") == "Para one.\n\nPara two."
+
+
+def test_chunks_with_keyword_matches_per_chunk_filter() -> None:
+    texts = ["Revenue grew", "nothing", "", "net REVENUE", "rev", "enue", "İ revenue"]
+    expected = [t for t in texts if "revenue" in t.lower()]
+    assert _chunks_with_keyword(texts, "Revenue") == expected
+    assert _chunks_with_keyword(texts[:-1], "revenue") == expected[:-1]
+    assert _chunks_with_keyword([], "revenue") == []
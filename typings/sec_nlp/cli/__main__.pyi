@@ -1,4 +1,5 @@
 import argparse
+from collections.abc import Sequence
 from pathlib import Path
 
 from _typeshed import Incomplete
@@ -12,7 +13,7 @@ from sec_nlp.core import setup_logging as setup_logging
 
 logger: Incomplete
 
-def parse_args() -> argparse.Namespace: ...
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace: ...
 def setup_folders(fresh: bool) -> tuple[Path, Path]: ...
 def cleanup_downloads(downloads_folder: Path) -> None: ...
-def main() -> None: ...
+def main(argv: Sequence[str] | None = None) -> None: ...
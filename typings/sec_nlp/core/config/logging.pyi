@@ -1,14 +1,18 @@
 import logging
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 from _typeshed import Incomplete
 
-from sec_nlp.core.config.settings import settings as settings
+from sec_nlp.core.config.settings import _get_settings as _get_settings
+
+_NOISY: tuple[str, ...]
+_CONFIGURED: tuple[tuple[Any, ...], tuple[logging.Handler, ...]] | None
 
 class ColoredFormatter(logging.Formatter):
     COLORS: Incomplete
     RESET: str
+    def __init__(self, *args: Any, **kwargs: Any) -> None: ...
     def format(self, record: logging.LogRecord) -> str: ...
 
 def setup_logging(
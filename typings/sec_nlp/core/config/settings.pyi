@@ -8,6 +8,7 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     model_config: Incomplete
     email: str
+    sec_rate_limit: int
     qdrant_host: str
     qdrant_port: int
     qdrant_grpc_port: int
@@ -22,11 +23,15 @@ class Settings(BaseSettings):
     qdrant_on_disk_payload: bool
     qdrant_replication_factor: int
     qdrant_write_consistency_factor: int
+    qdrant_upsert_batch_size: int
+    qdrant_upsert_parallelism: int
     embedding_model: str
     embedding_device: Literal["cpu", "cuda", "mps"]
     embedding_batch_size: int
+    embedding_backend: Literal["torch", "onnx", "onnx-int8"]
     ollama_base_url: str
     ollama_timeout: int
+    ollama_num_parallel: int
     hf_cache: Path | None
     transformers_cache: Path | None
     log_level: str
@@ -46,4 +51,4 @@ class Settings(BaseSettings):
 @lru_cache
 def _get_settings() -> Settings: ...
 
-settings: Incomplete
+settings: Settings
@@ -1,9 +1,8 @@
+from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
-from typing import Any
 
 from _typeshed import Incomplete
-from pydantic import BaseModel
 from sec_edgar_downloader import Downloader as SecEdgarDownloader
 
 from sec_nlp.core.config import get_logger as get_logger
@@ -11,19 +10,27 @@ from sec_nlp.core.enums import FilingMode as FilingMode
 
 logger: Incomplete
 
-class FilingManager(BaseModel):
+@dataclass(slots=True, eq=False)
+class FilingManager:
     email: str
     downloads_folder: Path
     company_name: str
     _symbols: set[str]
+    _sorted: tuple[str, ...] | None
     _downloader: SecEdgarDownloader | None
-    @classmethod
-    def _ensure_folder(cls, v: Path) -> Path: ...
-    def model_post_init(self, /, __ctx: Any) -> None: ...
+    def __post_init__(self) -> None: ...
     def add_symbol(self, symbol: str) -> None: ...
     def add_symbols(self, symbols: list[str]) -> None: ...
+    def _sorted_symbols(self) -> tuple[str, ...]: ...
     def download_filings(
         self, mode: FilingMode = ..., start_date: date | None = None, end_date: date | None = None
     ) -> dict[str, bool]: ...
+    def download_symbol(
+        self,
+        symbol: str,
+        mode: FilingMode = ...,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> bool: ...
     def __repr__(self) -> str: ...
     def __str__(self) -> str: ...
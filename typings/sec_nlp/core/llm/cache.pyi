@@ -0,0 +1,19 @@
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from _typeshed import Incomplete
+
+from sec_nlp.core.config import get_logger as get_logger
+
+logger: Incomplete
+__all__: list[str]
+
+class SummaryCache:
+    path: Path
+    def __init__(self, path: Path, memory_size: int = ...) -> None: ...
+    @staticmethod
+    def make_key(namespace: str, *parts: str) -> str: ...
+    def get_many(self, keys: list[str]) -> dict[str, dict[str, Any]]: ...
+    def put_many(self, items: Iterable[tuple[str, dict[str, Any]]]) -> None: ...
+    def close(self) -> None: ...
@@ -1,35 +1,54 @@
+from collections.abc import Callable, Sequence
+from functools import cache, lru_cache
 from typing import Any
 
 from langchain_core.language_models import BaseLanguageModel
 from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.prompts.base import BasePromptTemplate
 from langchain_core.runnables import Runnable
-from pydantic import BaseModel
-from typing_extensions import override
+from pydantic import BaseModel, ConfigDict
+from typing_extensions import TypedDict, override
 
-__all__ = ["SummarizationInput", "SummarizationOutput", "build_summarization_runnable"]
+__all__ = [
+    "SummarizationInput",
+    "SummarizationOutput",
+    "build_summarization_runnable",
+    "build_summarization_batch_fn",
+]
 
-class SummarizationInput(BaseModel):
+class SummarizationInput(TypedDict):
     chunk: str
     symbol: str
     search_term: str
 
 class SummarizationOutput(BaseModel):
+    model_config: ConfigDict
     summary: str | None
     points: list[str] | None
     confidence: float | None
     error: str | None
     raw_output: str | None
 
+@cache
+def _format_instructions(model: type[BaseModel]) -> str: ...
+
 class SummarizationOutputParser(PydanticOutputParser[SummarizationOutput]):
     pydantic_object: type[SummarizationOutput]
     def parse(self, text: str) -> SummarizationOutput: ...
+    @override
+    def get_format_instructions(self) -> str: ...
     @property
     def _type(self) -> str: ...
     @property
     @override
     def OutputType(self) -> type[SummarizationOutput]: ...
 
+@lru_cache(maxsize=1)
+def _output_parser() -> SummarizationOutputParser: ...
 def build_summarization_runnable(
     *, prompt: BasePromptTemplate[Any], llm: BaseLanguageModel[Any], require_json: bool = True
 ) -> Runnable[SummarizationInput, SummarizationOutput]: ...
+def _compile_formatter(prompt: BasePromptTemplate[Any]) -> Callable[..., str]: ...
+def build_summarization_batch_fn(
+    *, prompt: BasePromptTemplate[Any], llm: BaseLanguageModel[Any]
+) -> Callable[[Sequence[SummarizationInput]], list[SummarizationOutput]]: ...
@@ -1,3 +1,6 @@
+from functools import lru_cache
+from typing import Any, Literal
+
 from _typeshed import Incomplete
 from langchain_huggingface import HuggingFacePipeline
 
@@ -5,4 +8,20 @@ from sec_nlp.core.config import get_logger as get_logger
 
 logger: Incomplete
 
-def build_hf_pipeline(model_name: str) -> HuggingFacePipeline: ...
+Quantization = Literal["none", "auto", "int8", "nf4", "bf16", "fp16"]
+Backend = Literal["torch", "onnx"]
+
+def _auto_precision(torch: Any) -> Quantization: ...
+@lru_cache(maxsize=8)
+def _load_tokenizer(model_name: str) -> Any: ...
+@lru_cache(maxsize=2)
+def _load_onnx_model(model_name: str, provider: str) -> Any: ...
+def build_hf_pipeline(
+    model_name: str,
+    *,
+    batch_size: int = 16,
+    max_new_tokens: int = 1024,
+    compile_model: bool = False,
+    quantization: Quantization = "none",
+    backend: Backend = "torch",
+) -> HuggingFacePipeline: ...
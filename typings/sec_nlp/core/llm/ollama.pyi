@@ -1,12 +1,25 @@
 from typing import Any
 
 from _typeshed import Incomplete
+from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.outputs import LLMResult
 from langchain_ollama.llms import OllamaLLM
 
 from sec_nlp.core.config import get_logger as get_logger
+from sec_nlp.core.config import settings as settings
 
 logger: Incomplete
 
+class _ConcurrentOllamaLLM(OllamaLLM):
+    num_parallel: int
+    def _generate(
+        self,
+        prompts: list[str],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> LLMResult: ...
+
 def build_ollama_llm(
     model_name: str, base_url: str | None = None, temperature: float = 0.1, **kwargs: Any
 ) -> OllamaLLM: ...
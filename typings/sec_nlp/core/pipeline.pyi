@@ -1,11 +1,16 @@
+import re
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
 from datetime import date
 from pathlib import Path
-from typing import Any, Self
+from typing import Any, Literal, Self
 
+import numpy as np
 from _typeshed import Incomplete
 from langchain_core.language_models import BaseLanguageModel as BaseLanguageModel
 from langchain_core.prompts.base import BasePromptTemplate as BasePromptTemplate
 from langchain_core.runnables import Runnable as Runnable
+from numpy.typing import NDArray
 from pydantic import BaseModel, computed_field
 from qdrant_client import QdrantClient
 
@@ -13,16 +18,20 @@ from sec_nlp.core.config import get_logger as get_logger
 from sec_nlp.core.config import settings as settings
 from sec_nlp.core.downloader import FilingManager as FilingManager
 from sec_nlp.core.enums import FilingMode as FilingMode
+from sec_nlp.core.llm.cache import SummaryCache as SummaryCache
 from sec_nlp.core.llm.chains import SummarizationInput as SummarizationInput
 from sec_nlp.core.llm.chains import SummarizationOutput as SummarizationOutput
+from sec_nlp.core.llm.chains import build_summarization_batch_fn as build_summarization_batch_fn
 from sec_nlp.core.llm.chains import build_summarization_runnable as build_summarization_runnable
 from sec_nlp.core.preprocessor import Preprocessor as Preprocessor
 
 logger: Incomplete
 
-def _get_version() -> str: ...
+_SLUG_RE: re.Pattern[str]
+_SAFE_NAME_RE: re.Pattern[str]
+
 def _slugify(s: str) -> str: ...
-def _safe_name(s: str, allow: str = "a-zA-Z0-9._-") -> str: ...
+def _safe_name(s: str) -> str: ...
 def default_prompt_path() -> Path: ...
 def default_output_path() -> Path: ...
 def default_download_path() -> Path: ...
@@ -41,16 +50,27 @@ class Pipeline(BaseModel):
     require_json: bool
     max_retries: int
     batch_size: int
+    cache_summaries: bool
+    compile_llm: bool
+    quantization: Literal["none", "auto", "int8", "nf4", "bf16", "fp16"]
+    llm_backend: Literal["torch", "onnx"]
+    workers: int
+    fast_path: bool
     email: str | None
     collection_name: str | None
     dry_run: bool
     _prompt: BasePromptTemplate[Any]
-    _llm: BaseLanguageModel[Any]
+    _llm: BaseLanguageModel[Any] | None
     _pre: Preprocessor | None
+    _filings: FilingManager | None
     _qdrant: QdrantClient | None
     _embedder: Any | None
     _embedding_dim: int | None
     _graph: Runnable[SummarizationInput, SummarizationOutput] | None
+    _safe_kw: str
+    _prompt_hash: str
+    _summary_cache: SummaryCache | None
+    _batch_fn: Callable[[Sequence[SummarizationInput]], list[SummarizationOutput]] | None
     @classmethod
     def _check_start(cls, v: date) -> date: ...
     @classmethod
@@ -71,18 +91,58 @@ class Pipeline(BaseModel):
     def keyword_lower(self) -> str: ...
     def _collection_slug(self, symbol: str) -> str: ...
     def model_post_init(self, /, __ctx: Any) -> None: ...
+    def _get_llm(self) -> BaseLanguageModel[Any]: ...
+    def _get_filing_manager(self) -> FilingManager: ...
     def _get_preprocessor(self) -> Preprocessor: ...
     def _ensure_qdrant(self) -> QdrantClient: ...
     def _ensure_embedder(self) -> Any: ...
     def _ensure_collection(self, collection_name: str) -> None: ...
-    def _embed_texts(self, texts: list[str]) -> list[list[float]]: ...
+    def _embed_texts(self, texts: list[str]) -> NDArray[np.float32]: ...
     def _upsert_texts(
         self,
         collection_name: str,
         texts: list[str],
         metadata: list[dict[str, Any]] | None = None,
         ids: list[str] | None = None,
+        common_meta: dict[str, Any] | None = None,
     ) -> list[str]: ...
     def _get_graph(self) -> Runnable[SummarizationInput, SummarizationOutput]: ...
+    def _batch_summarize(
+        self,
+        graph: Runnable[SummarizationInput, SummarizationOutput],
+        items: list[SummarizationInput],
+    ) -> list[SummarizationOutput]: ...
+    def _get_summary_cache(self) -> SummaryCache: ...
+    def _summarize_cached(
+        self,
+        graph: Runnable[SummarizationInput, SummarizationOutput],
+        window: list[SummarizationInput],
+    ) -> list[dict[str, Any]]: ...
     def run_all(self, symbols: list[str]) -> dict[str, list[Path]]: ...
+    async def run_all_async(self, symbols: list[str]) -> dict[str, list[Path]]: ...
+    def _process_many(self, symbols: list[str]) -> dict[str, list[Path]]: ...
+    def _parse_pool(self) -> ProcessPoolExecutor | None: ...
+    def _download(self, symbol: str) -> bool: ...
     def run(self, symbol: str) -> list[Path]: ...
+    def _process(self, symbol: str, parser: Executor | None = None) -> list[Path]: ...
+    def _write_summary(self, out_file: Path, payload: dict[str, Any]) -> Path: ...
+    def _iter_summaries(
+        self,
+        symbol: str,
+        pre: Preprocessor,
+        graph: Runnable[SummarizationInput, SummarizationOutput],
+        html_paths: list[Path],
+        collection_name: str,
+        out_prefix: str,
+        upserter: Executor,
+        parsed: Mapping[Path, Future[None]],
+    ) -> Iterator[tuple[Path, dict[str, Any]]]: ...
+
+_INT8_ONNX_FILE: str
+
+def _load_int8_embedder(model_name: str, device: str) -> Any: ...
+
+_WORKER_PIPELINE: Pipeline | None
+
+def _init_worker(num_threads: int, config: dict[str, Any]) -> None: ...
+def _process_in_worker(symbol: str) -> list[Path]: ...
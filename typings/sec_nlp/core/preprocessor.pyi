@@ -1,4 +1,6 @@
-from collections.abc import Sequence
+import re
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Executor, Future
 from pathlib import Path
 from typing import Any
 
@@ -12,12 +14,20 @@ from sec_nlp.core.enums import FilingMode as FilingMode
 
 logger: Incomplete
 
+_HSPACE_RE: re.Pattern[str]
+_LINE_EDGE_RE: re.Pattern[str]
+_BLANK_LINES_RE: re.Pattern[str]
+
+def _clean_text(text: str) -> str: ...
+def _chunks_with_keyword(texts: Sequence[str], keyword: str) -> list[str]: ...
+
 class Preprocessor(BaseModel):
     downloads_folder: Path
     chunk_size: int
     chunk_overlap: int
     splitter: str
     transformer: str
+    cache_transforms: bool
     _splitter_impl: RecursiveCharacterTextSplitter
     @classmethod
     def _ensure_root(cls, v: Path) -> Path: ...
@@ -28,6 +38,13 @@ class Preprocessor(BaseModel):
     def html_paths_for_symbol(
         self, symbol: str, mode: FilingMode = ..., limit: int | None = None
     ) -> list[Path]: ...
+    def _cache_file(self, html_path: Path) -> Path: ...
     def transform_html(self, html_path: Path) -> Sequence[Document]: ...
+    def submit_transforms(
+        self, pool: Executor, html_paths: Sequence[Path]
+    ) -> dict[Path, Future[None]]: ...
+    def iter_relevant_chunks(self, html_path: Path, keyword: str) -> Iterator[str]: ...
     def html_to_text(self, html_path: Path) -> list[str]: ...
     def batch_transform_html(self, html_paths: list[Path]) -> list[Document]: ...
+
+def _transform_in_worker(config: dict[str, Any], html_path: Path) -> None: ...
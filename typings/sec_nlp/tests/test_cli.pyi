@@ -1,7 +1,3 @@
 from pathlib import Path
 
-import pytest
-
-def test_cli_main_wires_pipeline_and_cleans(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None: ...
+def test_cli_main_wires_pipeline_and_cleans(tmp_path: Path) -> None: ...
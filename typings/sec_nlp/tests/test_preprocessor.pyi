@@ -5,3 +5,4 @@ from sec_nlp.core.preprocessor import Preprocessor as Preprocessor
 
 def test_html_paths_for_symbol_and_limit(tmp_path: Path, write_html_tree) -> None: ...
 def test_html_paths_for_symbol_missing_raises(tmp_path) -> None: ...
+def test_transform_html_served_from_cache(tmp_path: Path, monkeypatch) -> None: ...